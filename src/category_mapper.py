@@ -7,6 +7,7 @@ in visualizations, providing a consistent user experience.
 """
 
 import logging
+from itertools import cycle, islice
 from typing import Dict, List, Optional
 
 from config import Config
@@ -35,6 +36,15 @@ class CategoryMapper:
         self._savings_category_colors: Dict[str, str] = {}
         self._load_category_mappings()
 
+        # Fallback colors for unmapped categories, resolved from the palette once
+        # instead of on every lookup
+        palette = self.config.get("color_palette", {})
+        self._expense_default_color: str = palette.get("expense", "#F45D48")
+        self._income_default_color: str = palette.get("income", "#078080")
+        self._savings_default_color: str = palette.get("savings", {}).get(
+            "general", "#078080"
+        )
+
     def _load_category_mappings(self) -> None:
         """
         Load category to color mappings from configuration.
@@ -80,9 +90,7 @@ class CategoryMapper:
             return
 
         # Create mappings using the available colors, cycling if needed
-        for i, category in enumerate(categories):
-            color_index = i % len(colors)
-            self._expense_category_colors[category] = colors[color_index]
+        self._expense_category_colors = dict(zip(categories, cycle(colors)))
 
     def _create_income_category_mapping(self) -> None:
         """Create color mappings for income categories."""
@@ -98,9 +106,9 @@ class CategoryMapper:
         # Use a different starting point in the color palette for income categories
         # to differentiate them from expense categories
         offset = 8  # Start from a different point in the color palette
-        for i, category in enumerate(categories):
-            color_index = (i + offset) % len(colors)
-            self._income_category_colors[category] = colors[color_index]
+        self._income_category_colors = dict(
+            zip(categories, islice(cycle(colors), offset % len(colors), None))
+        )
 
     def _create_savings_category_mapping(self) -> None:
         """Create color mappings for savings categories."""
@@ -115,9 +123,9 @@ class CategoryMapper:
 
         # Use a different starting point in the color palette for savings
         offset = 4  # Different offset from income categories
-        for i, category in enumerate(categories):
-            color_index = (i + offset) % len(colors)
-            self._savings_category_colors[category] = colors[color_index]
+        self._savings_category_colors = dict(
+            zip(categories, islice(cycle(colors), offset % len(colors), None))
+        )
 
     def get_expense_category_color(self, category: str) -> str:
         """
@@ -129,8 +137,7 @@ class CategoryMapper:
         Returns:
             str: The color code for the category, or a default color if not found
         """
-        default_color = self.config.get("color_palette", {}).get("expense", "#F45D48")
-        return self._expense_category_colors.get(category, default_color)
+        return self._expense_category_colors.get(category, self._expense_default_color)
 
     def get_income_category_color(self, category: str) -> str:
         """
@@ -142,8 +149,7 @@ class CategoryMapper:
         Returns:
             str: The color code for the category, or a default color if not found
         """
-        default_color = self.config.get("color_palette", {}).get("income", "#078080")
-        return self._income_category_colors.get(category, default_color)
+        return self._income_category_colors.get(category, self._income_default_color)
 
     def get_savings_category_color(self, category: str) -> str:
         """
@@ -155,12 +161,7 @@ class CategoryMapper:
         Returns:
             str: The color code for the category, or a default color if not found
         """
-        default_color = (
-            self.config.get("color_palette", {})
-            .get("savings", {})
-            .get("general", "#078080")
-        )
-        return self._savings_category_colors.get(category, default_color)
+        return self._savings_category_colors.get(category, self._savings_default_color)
 
     def get_expense_colors(self, categories: List[str]) -> List[str]:
         """
@@ -172,7 +173,9 @@ class CategoryMapper:
         Returns:
             List[str]: List of color codes for the categories
         """
-        return [self.get_expense_category_color(category) for category in categories]
+        colors = self._expense_category_colors
+        default_color = self._expense_default_color
+        return [colors.get(category, default_color) for category in categories]
 
     def get_income_colors(self, categories: List[str]) -> List[str]:
         """
@@ -184,7 +187,9 @@ class CategoryMapper:
         Returns:
             List[str]: List of color codes for the categories
         """
-        return [self.get_income_category_color(category) for category in categories]
+        colors = self._income_category_colors
+        default_color = self._income_default_color
+        return [colors.get(category, default_color) for category in categories]
 
     def get_savings_colors(self, categories: List[str]) -> List[str]:
         """
@@ -196,7 +201,9 @@ class CategoryMapper:
         Returns:
             List[str]: List of color codes for the categories
         """
-        return [self.get_savings_category_color(category) for category in categories]
+        colors = self._savings_category_colors
+        default_color = self._savings_default_color
+        return [colors.get(category, default_color) for category in categories]
 
     def get_category_colors_dict(
         self, category_type: str = "expenses"
@@ -8,9 +8,11 @@ data loading, filtering, and callback management functionality for the
 financial dashboard.
 """
 
-import calendar
 import logging
 import os
+import tempfile
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -18,6 +20,9 @@ import dash
 import polars as pl
 from dash import Input, Output
 
+# Number of month ranges whose serialized dashboard outputs are kept in memory
+OUTPUT_CACHE_SIZE = 64
+
 
 class DatasetLoader:
     """
@@ -38,6 +43,12 @@ class DatasetLoader:
         self.config = config
         self.logger = logger.getChild("DatasetLoader")
         self.datasets: Dict[str, Optional[pl.DataFrame]] = {}
+        self._dataset_cache: Dict[str, Tuple[float, pl.DataFrame]] = {}
+        self._month_bounds: Dict[str, Tuple[str, str]] = {}
+        self._category_totals: Dict[str, Optional[pl.DataFrame]] = {}
+        self._load_count = 0
+        self.cache_folder = config.get("cache_folder", "output/cache")
+        self.output_format = config.get("output_format", "csv")
         self.min_date: datetime = datetime.now()
         self.max_date: datetime = datetime.now()
         self.min_month: str = ""
@@ -45,32 +56,67 @@ class DatasetLoader:
 
     def load_all_datasets(self) -> None:
         """Load all datasets required for visualization and determine date range."""
+        # Totals derived from previously loaded data are rebuilt on demand
+        self._category_totals.clear()
+        self._load_count += 1
+
         # Load monthly summary data
-        self.datasets["monthly_summary"] = self._load_csv("monthly_summary_path")
+        self.datasets["monthly_summary"] = self._load_dataset("monthly_summary_path")
 
         # Load expense and income breakdowns
-        self.datasets["expenses_by_category"] = self._load_csv(
+        self.datasets["expenses_by_category"] = self._load_dataset(
             "expenses_by_category_path"
         )
-        self.datasets["expenses_stacked"] = self._load_csv("expenses_stacked_path")
-        self.datasets["income_by_category"] = self._load_csv("income_by_category_path")
-        self.datasets["income_stacked"] = self._load_csv("income_stacked_path")
+        self.datasets["expenses_stacked"] = self._load_dataset("expenses_stacked_path")
+        self.datasets["income_by_category"] = self._load_dataset(
+            "income_by_category_path"
+        )
+        self.datasets["income_stacked"] = self._load_dataset("income_stacked_path")
 
         # Load savings data
-        self.datasets["savings_metrics"] = self._load_csv("savings_metrics_path")
-        self.datasets["savings_by_category"] = self._load_csv(
+        self.datasets["savings_metrics"] = self._load_dataset("savings_metrics_path")
+        self.datasets["savings_by_category"] = self._load_dataset(
             "savings_by_category_path"
         )
-        self.datasets["savings_allocation"] = self._load_csv("savings_allocation_path")
-        self.datasets["processed_savings"] = self._load_csv("processed_savings_path")
+        self.datasets["savings_allocation"] = self._load_dataset(
+            "savings_allocation_path"
+        )
+        self.datasets["processed_savings"] = self._load_memory_mapped(
+            "processed_savings", "processed_savings_path"
+        )
 
         # Load processed raw data for filtering by date
-        self.datasets["processed_expenses"] = self._load_csv("processed_expenses_path")
-        self.datasets["processed_income"] = self._load_csv("processed_income_path")
+        self.datasets["processed_expenses"] = self._load_memory_mapped(
+            "processed_expenses", "processed_expenses_path"
+        )
+        self.datasets["processed_income"] = self._load_memory_mapped(
+            "processed_income", "processed_income_path"
+        )
 
         # Determine date range
         self._determine_date_range()
 
+    def data_signature(self) -> Tuple[Any, ...]:
+        """
+        Identify the version of the data the loader currently serves.
+
+        The signature changes whenever load_all_datasets runs or a generated
+        dataset file is rewritten, which _load_dataset picks up on its next read.
+
+        Returns:
+            Tuple[Any, ...]: Load count and modification times of the loaded datasets
+        """
+        mtimes: List[Optional[float]] = []
+        for config_key in sorted(self._dataset_cache):
+            # A file removed since it was loaded, even right after the existence
+            # check, has no modification time
+            path = self._dataset_path(config_key)
+            try:
+                mtimes.append(os.path.getmtime(path) if path else None)
+            except OSError:
+                mtimes.append(None)
+        return (self._load_count, *mtimes)
+
     def _load_csv(self, config_key: str) -> Optional[pl.DataFrame]:
         """
         Load a CSV file specified in the configuration.
@@ -91,21 +137,248 @@ class DatasetLoader:
             self.logger.error(f"Error loading {path}: {str(e)}")
             return None
 
+    def _dataset_path(self, config_key: str) -> Optional[str]:
+        """
+        Get the path of a generated dataset, following the configured output_format.
+
+        Parquet datasets are written next to their configured path with a
+        .parquet extension.
+
+        Args:
+            config_key: Key in the configuration for the file path
+
+        Returns:
+            str or None: Path of the dataset if the file exists, None otherwise
+        """
+        path = self.config.get(config_key)
+        if path and self.output_format == "parquet":
+            path = os.path.splitext(path)[0] + ".parquet"
+        if not path or not os.path.exists(path):
+            return None
+        return path
+
+    def _load_dataset(self, config_key: str) -> Optional[pl.DataFrame]:
+        """
+        Load a generated dataset, reading the file only when it has changed.
+
+        Loaded frames are kept in memory keyed on the file's modification time,
+        so repeated callbacks reuse them while a regenerated file is picked up.
+
+        Args:
+            config_key: Key in the configuration for the file path
+
+        Returns:
+            pl.DataFrame or None: DataFrame if the file exists, None otherwise
+        """
+        path = self._dataset_path(config_key)
+        if path is None:
+            return None
+
+        mtime = os.path.getmtime(path)
+        cached = self._dataset_cache.get(config_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            if path.endswith(".parquet"):
+                df = pl.read_parquet(path)
+            else:
+                df = pl.read_csv(path)
+        except Exception as e:
+            self.logger.error(f"Error loading {path}: {str(e)}")
+            return None
+
+        self._dataset_cache[config_key] = (mtime, df)
+
+        # Remember the month span of the dataset, so month filters covering all
+        # of it can return the frame without a filter pass
+        if "Month" in df.columns and len(df) > 0:
+            self._month_bounds[config_key] = (df["Month"].min(), df["Month"].max())
+        else:
+            self._month_bounds.pop(config_key, None)
+
+        return df
+
+    def _load_memory_mapped(self, name: str, config_key: str) -> Optional[pl.DataFrame]:
+        """
+        Load a processed CSV once and memory-map it back from an Arrow IPC copy.
+
+        The Date column is parsed and sorted before the IPC copy is written, so the
+        callbacks can slice the mapped frame by date without re-reading the CSV.
+        The OS only pages in the columns that are actually touched. An IPC copy
+        newer than its CSV is mapped directly, skipping the CSV parse on restart.
+
+        Args:
+            name: Name of the dataset, used for the IPC file name
+            config_key: Key in the configuration for the CSV file path
+
+        Returns:
+            pl.DataFrame or None: Memory-mapped DataFrame if the file exists, None otherwise
+        """
+        csv_path = self.config.get(config_key)
+        ipc_path = os.path.join(self.cache_folder, f"{name}.arrow")
+        if (
+            csv_path
+            and os.path.exists(csv_path)
+            and os.path.exists(ipc_path)
+            and os.path.getmtime(ipc_path) >= os.path.getmtime(csv_path)
+        ):
+            try:
+                df = pl.read_ipc(ipc_path, memory_map=True)
+                if "Date" in df.columns:
+                    df = df.set_sorted("Date")
+                return df
+            except Exception as e:
+                self.logger.warning(
+                    f"Could not reuse the IPC copy of {name}, rebuilding it: {str(e)}"
+                )
+
+        df = self._load_csv(config_key)
+        if df is None:
+            return None
+
+        if "Date" in df.columns:
+            if df.schema["Date"] == pl.Utf8:
+                df = df.with_columns(pl.col("Date").str.to_datetime().alias("Date"))
+            df = df.sort("Date")
+
+        try:
+            os.makedirs(self.cache_folder, exist_ok=True)
+            self._write_ipc_atomic(df, ipc_path)
+            df = pl.read_ipc(ipc_path, memory_map=True)
+        except Exception as e:
+            self.logger.warning(
+                f"Could not memory-map {name}, keeping it in memory: {str(e)}"
+            )
+
+        # The sorted flag is not stored in the IPC file, restore it after reading
+        if "Date" in df.columns:
+            df = df.set_sorted("Date")
+
+        return df
+
+    def _write_ipc_atomic(self, df: pl.DataFrame, ipc_path: str) -> None:
+        """
+        Write an Arrow IPC file by replacing it with a complete new file.
+
+        Frames loaded earlier may still be memory-mapped from the old file, so
+        it is never overwritten in place: the data goes to a temporary file in
+        the cache folder, which is then moved over the old one.
+
+        Args:
+            df: DataFrame to write
+            ipc_path: Destination path of the IPC file
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.cache_folder, prefix=".", suffix=".arrow.tmp"
+        )
+        os.close(fd)
+        try:
+            df.write_ipc(tmp_path)
+            os.replace(tmp_path, ipc_path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _slice_date_range(
+        df: pl.DataFrame, start_date: datetime, end_date: datetime
+    ) -> pl.DataFrame:
+        """
+        Select the rows between two dates (inclusive) of a frame sorted by Date.
+
+        Uses a binary search on the sorted Date column instead of a full
+        comparison pass over every row.
+
+        Args:
+            df: DataFrame sorted by its Date column
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            pl.DataFrame: Rows with start_date <= Date <= end_date
+        """
+        start = df["Date"].search_sorted(start_date, side="left")
+        end = df["Date"].search_sorted(end_date, side="right")
+        return df.slice(start, max(end - start, 0))
+
+    @staticmethod
+    def _covers_whole_months(start_date: datetime, end_date: datetime) -> bool:
+        """
+        Check whether a date range runs from a month's first day to a month's last day.
+
+        Args:
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            bool: True if the range is made of whole calendar months
+        """
+        return (
+            start_date == datetime(start_date.year, start_date.month, 1)
+            and end_date == datetime(end_date.year, end_date.month, end_date.day)
+            and (end_date + timedelta(days=1)).day == 1
+        )
+
+    def _month_category_totals(
+        self, dataset_key: str, df: pl.DataFrame
+    ) -> Optional[pl.DataFrame]:
+        """
+        Get the per-month category totals of a processed dataset, built once.
+
+        The totals keep the Date, Category and Value columns, with Date set to
+        the start of the month and sorted. Totals are only built when every Date
+        is a plain day, so a whole-month range selects the same records from the
+        totals as from the individual rows.
+
+        Args:
+            dataset_key: Key for the raw dataset in self.datasets
+            df: The raw dataset, with a datetime Date column
+
+        Returns:
+            pl.DataFrame or None: Monthly category totals, None if not applicable
+        """
+        if dataset_key not in self._category_totals:
+            totals = None
+            is_plain_day = pl.col("Date") == pl.col("Date").dt.truncate("1d")
+            if df.select(is_plain_day.all()).item():
+                totals = (
+                    df.group_by(
+                        pl.col("Date").dt.truncate("1mo"),
+                        "Category",
+                        maintain_order=False,
+                    )
+                    .agg(pl.sum("Value"))
+                    .sort("Date")
+                )
+            self._category_totals[dataset_key] = totals
+
+        return self._category_totals[dataset_key]
+
     def _determine_date_range(self) -> None:
         """Determine the min and max dates from the loaded data."""
         monthly_summary = self.datasets["monthly_summary"]
 
         if monthly_summary is not None and len(monthly_summary) > 0:
-            self.min_month = monthly_summary["Month"].min()
-            self.max_month = monthly_summary["Month"].max()
-
-            # Convert to date objects for the date picker
-            self.min_date = datetime.strptime(f"{self.min_month}-01", "%Y-%m-%d")
-            self.max_date = datetime.strptime(f"{self.max_month}-01", "%Y-%m-%d")
-            # Add a month to the max date to include the full month
-            self.max_date = (self.max_date.replace(day=28) + timedelta(days=4)).replace(
-                day=1
-            ) - timedelta(days=1)
+            # Get the month bounds and convert them to dates for the date picker
+            # in one query, the max date is the last day of the max month
+            first_day = pl.lit("-01")
+            self.min_month, self.max_month, self.min_date, self.max_date = (
+                monthly_summary.select(
+                    pl.col("Month").min().alias("MinMonth"),
+                    pl.col("Month").max().alias("MaxMonth"),
+                )
+                .with_columns(
+                    pl.concat_str(pl.col("MinMonth"), first_day)
+                    .str.to_datetime("%Y-%m-%d")
+                    .alias("MinDate"),
+                    pl.concat_str(pl.col("MaxMonth"), first_day)
+                    .str.to_datetime("%Y-%m-%d")
+                    .dt.month_end()
+                    .alias("MaxDate"),
+                )
+                .row(0)
+            )
         else:
             # Default to current month if no data
             today = datetime.now()
@@ -114,51 +387,76 @@ class DatasetLoader:
             self.min_month = self.min_date.strftime("%Y-%m")
             self.max_month = self.max_date.strftime("%Y-%m")
 
-    def filter_monthly_dataset(
-        self, config_key: str, start_month: str, end_month: str
-    ) -> Optional[pl.DataFrame]:
+    def filter_monthly_datasets(
+        self, month_ranges: List[Tuple[str, str, str]]
+    ) -> List[Optional[pl.DataFrame]]:
         """
-        Filter a dataset by month range.
+        Filter several datasets by month range in a single engine call.
+
+        The filters are planned lazily and collected together, so Polars runs
+        them in parallel instead of one after the other.
 
         Args:
-            config_key: Key in the configuration for the file path
-            start_month: Start month in 'YYYY-MM' format
-            end_month: End month in 'YYYY-MM' format
+            month_ranges: Config key, start month and end month ('YYYY-MM') of
+                every dataset to filter
 
         Returns:
-            pl.DataFrame or None: Filtered DataFrame
+            List[Optional[pl.DataFrame]]: Filtered DataFrames, in the order of
+                month_ranges
         """
-        df = self._load_csv(config_key)
-        if df is None or len(df) == 0 or "Month" not in df.columns:
-            return df
+        results: List[Optional[pl.DataFrame]] = []
+        plans: List[pl.LazyFrame] = []
+        plan_positions: List[int] = []
+        for config_key, start_month, end_month in month_ranges:
+            df = self._load_dataset(config_key)
+            if df is None or len(df) == 0 or "Month" not in df.columns:
+                results.append(df)
+                continue
+
+            # The range covers every month of the dataset, e.g. the default view
+            month_bounds = self._month_bounds.get(config_key)
+            if (
+                month_bounds is not None
+                and start_month <= month_bounds[0]
+                and end_month >= month_bounds[1]
+            ):
+                results.append(df)
+                continue
+
+            plan_positions.append(len(results))
+            results.append(None)
+            plans.append(
+                df.lazy().filter(
+                    (pl.col("Month") >= start_month) & (pl.col("Month") <= end_month)
+                )
+            )
 
-        return df.filter(
-            (pl.col("Month") >= start_month) & (pl.col("Month") <= end_month)
-        )
+        if plans:
+            for position, df in zip(plan_positions, pl.collect_all(plans)):
+                results[position] = df
+
+        return results
 
     def filter_daily_dataset(
-        self, config_key: str, start_date: datetime, end_date: datetime
+        self, dataset_key: str, start_date: datetime, end_date: datetime
     ) -> Optional[pl.DataFrame]:
         """
-        Filter a dataset by date range.
+        Filter a loaded dataset by date range.
 
         Args:
-            config_key: Key in the configuration for the file path
+            dataset_key: Key for the raw dataset in self.datasets
             start_date: Start date
             end_date: End date
 
         Returns:
             pl.DataFrame or None: Filtered DataFrame
         """
-        df = self._load_csv(config_key)
+        df = self.datasets.get(dataset_key)
         if df is None or len(df) == 0 or "Date" not in df.columns:
             return df
 
-        # Convert string dates to datetime if needed
-        if df["Date"].dtype == pl.Utf8:
-            df = df.with_columns(pl.col("Date").str.to_datetime().alias("Date"))
-
-        return df.filter((pl.col("Date") >= start_date) & (pl.col("Date") <= end_date))
+        # Date was parsed once when the dataset was loaded
+        return self._slice_date_range(df, start_date, end_date)
 
     def get_dataset(self, name: str) -> Optional[pl.DataFrame]:
         """
@@ -203,14 +501,14 @@ class DatasetLoader:
             )
             return None
 
-        # Ensure Date is datetime
-        if df["Date"].dtype == pl.Utf8:
-            df = df.with_columns(pl.col("Date").str.to_datetime().alias("Date"))
-
-        # Filter by date range
-        filtered_df = df.filter(
-            (pl.col("Date") >= start_date) & (pl.col("Date") <= end_date)
-        )
+        # Filter by date range, Date was parsed once when the dataset was loaded.
+        # Whole-month ranges, which is what the month pickers produce, are read
+        # from the monthly category totals instead of the individual transactions
+        totals = self._month_category_totals(dataset_key, df)
+        if totals is not None and self._covers_whole_months(start_date, end_date):
+            filtered_df = self._slice_date_range(totals, start_date, end_date)
+        else:
+            filtered_df = self._slice_date_range(df, start_date, end_date)
 
         if len(filtered_df) == 0:
             self.logger.warning(f"No data in date range for {dataset_key}")
@@ -218,7 +516,7 @@ class DatasetLoader:
 
         # Group by category and sum values
         result = (
-            filtered_df.groupby("Category")
+            filtered_df.group_by("Category", maintain_order=False)
             .agg(pl.sum("Value").alias("Total"))
             .sort("Total", descending=True)
         )
@@ -233,6 +531,15 @@ def setup_callbacks(dashboard_instance) -> None:
     Args:
         dashboard_instance: The FinanceDashboard instance containing the app and other components
     """
+    # Serialized outputs keyed on the selected month range and the version of the
+    # loaded data. Figures are stored in their plotly JSON form so a repeated range
+    # skips both the figure building and the conversion of the figure objects on
+    # the way out. The cache keeps the most recently used ranges, up to
+    # OUTPUT_CACHE_SIZE entries, and misses once the data is reloaded.
+    # Dash may serve callbacks from several threads, so every access to the cache
+    # holds output_cache_lock
+    output_cache: OrderedDict[Tuple[Any, ...], Tuple[Any, ...]] = OrderedDict()
+    output_cache_lock = threading.Lock()
 
     @dashboard_instance.app.callback(
         [
@@ -270,17 +577,25 @@ def setup_callbacks(dashboard_instance) -> None:
         Returns:
             Tuple containing all dashboard components in the order of the Output callbacks
         """
+        cache_key = (
+            start_month,
+            end_month,
+            dashboard_instance.dataset_loader.data_signature(),
+        )
+        with output_cache_lock:
+            if cache_key in output_cache:
+                output_cache.move_to_end(cache_key)
+                return output_cache[cache_key]
+
         try:
             parsed_start_date = datetime.strptime(start_month, "%Y-%m-%d")
             parsed_end_date = datetime.strptime(end_month, "%Y-%m-%d")
 
-            # For end date, we want the last day of the selected month
-            last_day = calendar.monthrange(parsed_end_date.year, parsed_end_date.month)[
-                1
-            ]
-            parsed_end_date = datetime(
-                parsed_end_date.year, parsed_end_date.month, last_day
-            )
+            # For end date, we want the last day of the selected month: the day
+            # before the first day of the next month
+            parsed_end_date = (
+                parsed_end_date.replace(day=28) + timedelta(days=4)
+            ).replace(day=1) - timedelta(days=1)
 
         except ValueError as e:
             dashboard_instance.logger.error(f"Error parsing dates: {str(e)}")
@@ -292,42 +607,47 @@ def setup_callbacks(dashboard_instance) -> None:
         start_month_str = parsed_start_date.strftime("%Y-%m")
         end_month_str = parsed_end_date.strftime("%Y-%m")
 
-        # Filter datasets by date range
-        filtered_monthly_summary = (
-            dashboard_instance.dataset_loader.filter_monthly_dataset(
-                "monthly_summary_path", start_month_str, end_month_str
-            )
-        )
-
-        # For the savings metrics, use all data from the beginning up to the selected end date
-        filtered_savings_metrics = (
-            dashboard_instance.dataset_loader.filter_monthly_dataset(
-                "savings_metrics_path",
-                dashboard_instance.dataset_loader.min_month,
-                end_month_str,
-            )
-        )
-
-        filtered_expenses_stacked = (
-            dashboard_instance.dataset_loader.filter_monthly_dataset(
-                "expenses_stacked_path", start_month_str, end_month_str
-            )
-        )
-        filtered_income_stacked = (
-            dashboard_instance.dataset_loader.filter_monthly_dataset(
-                "income_stacked_path", start_month_str, end_month_str
-            )
+        # Filter the monthly datasets by date range in one engine call. For the
+        # savings metrics, use all data from the beginning up to the selected
+        # end date
+        (
+            filtered_monthly_summary,
+            filtered_savings_metrics,
+            filtered_expenses_stacked,
+            filtered_income_stacked,
+        ) = dashboard_instance.dataset_loader.filter_monthly_datasets(
+            [
+                ("monthly_summary_path", start_month_str, end_month_str),
+                (
+                    "savings_metrics_path",
+                    dashboard_instance.dataset_loader.min_month,
+                    end_month_str,
+                ),
+                ("expenses_stacked_path", start_month_str, end_month_str),
+                ("income_stacked_path", start_month_str, end_month_str),
+            ]
         )
 
         # For savings data, include all transactions up to the end date
         filtered_processed_savings = (
             dashboard_instance.dataset_loader.filter_daily_dataset(
-                "processed_savings_path",
+                "processed_savings",
                 dashboard_instance.dataset_loader.min_date,
                 parsed_end_date,
             )
         )
 
+        # Derive the Month key of the savings transactions once, the savings
+        # charts below reuse it instead of each formatting every row again
+        if (
+            filtered_processed_savings is not None
+            and len(filtered_processed_savings) > 0
+            and "Month" not in filtered_processed_savings.columns
+        ):
+            filtered_processed_savings = filtered_processed_savings.with_columns(
+                pl.col("Date").dt.strftime("%Y-%m").alias("Month")
+            )
+
         # Calculate category breakdowns based on the filtered date range
         filtered_expenses_by_category = (
             dashboard_instance.dataset_loader.calculate_category_breakdown(
@@ -431,12 +751,12 @@ def setup_callbacks(dashboard_instance) -> None:
         # Filter processed expenses and income for category statistics
         filtered_processed_expenses = (
             dashboard_instance.dataset_loader.filter_daily_dataset(
-                "processed_expenses_path", parsed_start_date, parsed_end_date
+                "processed_expenses", parsed_start_date, parsed_end_date
             )
         )
         filtered_processed_income = (
             dashboard_instance.dataset_loader.filter_daily_dataset(
-                "processed_income_path", parsed_start_date, parsed_end_date
+                "processed_income", parsed_start_date, parsed_end_date
             )
         )
 
@@ -466,8 +786,7 @@ def setup_callbacks(dashboard_instance) -> None:
             )
         )
 
-        return (
-            summary_cards,
+        figures = (
             fig_main_overview,
             fig_expense_pie_chart,
             fig_income_pie_chart,
@@ -485,3 +804,11 @@ def setup_callbacks(dashboard_instance) -> None:
             fig_expense_category_stats,
             fig_income_category_stats,
         )
+
+        outputs = (summary_cards,) + tuple(fig.to_plotly_json() for fig in figures)
+        with output_cache_lock:
+            output_cache[cache_key] = outputs
+            if len(output_cache) > OUTPUT_CACHE_SIZE:
+                output_cache.popitem(last=False)
+
+        return outputs
@@ -174,7 +174,7 @@ class ChartFactory:
 
         # Create a donut chart for categories
         labels = df_categories["Category"].to_list()
-        values = df_categories["Total"].to_list()
+        values = df_categories["Total"].to_numpy()
 
         # Get consistent colors for the categories
         if is_income:
@@ -183,9 +183,10 @@ class ChartFactory:
             colors = self.category_mapper.get_expense_colors(labels)
 
         # Create custom hover text with formatted values
+        total = values.sum()
         hover_texts = []
         for label, value in zip(labels, values):
-            percentage = (value / sum(values) * 100) if sum(values) > 0 else 0
+            percentage = (value / total * 100) if total > 0 else 0
             hover_texts.append(f"{label}: {value:,.2f}€ ({percentage:.1f}%)")
 
         fig = go.Figure(
@@ -274,15 +275,10 @@ class ChartFactory:
 
         # Get consistent colors for the categories
         if is_income:
-            color_map = {
-                category: self.category_mapper.get_income_category_color(category)
-                for category in unique_categories
-            }
+            colors = self.category_mapper.get_income_colors(unique_categories)
         else:
-            color_map = {
-                category: self.category_mapper.get_expense_category_color(category)
-                for category in unique_categories
-            }
+            colors = self.category_mapper.get_expense_colors(unique_categories)
+        color_map = dict(zip(unique_categories, colors))
 
         # Get all months for consistent x-axis
         all_months = sorted(df_stacked["Month"].unique().to_list())
@@ -307,54 +303,39 @@ class ChartFactory:
             ][int(month) - 1]
             months.append(f"{month_name} {year}")
 
-        # Create monthly data structure and calculate percentages
-        monthly_data = {}
-        for month_display, month_raw in zip(months, all_months):
-            month_df = df_stacked.filter(pl.col("Month") == month_raw)
-            total = month_df[value_column].sum()
-
-            # Get category data sorted by value
-            cat_data = []
-            for category in unique_categories:
-                cat_df = month_df.filter(pl.col("Category") == category)
-                if len(cat_df) > 0:
-                    value = cat_df[value_column].sum()
-                    if value > 0:  # Only include categories with values
-                        percentage = (value / total * 100) if total > 0 else 0
-                        cat_data.append(
-                            {
-                                "category": category,
-                                "value": value,
-                                "percentage": percentage,
-                                "color": color_map[category],
-                            }
-                        )
-
-            # Sort by value (largest first)
-            cat_data.sort(key=lambda x: x["value"], reverse=True)
-
-            monthly_data[month_display] = {"total": total, "categories": cat_data}
-
-        # Create the figure
-        fig = go.Figure()
+        # Monthly totals for the percentage calculation in a single aggregation
+        month_totals = dict(
+            df_stacked.group_by("Month").agg(pl.col(value_column).sum()).iter_rows()
+        )
+
+        # Materialize every category's rows in one pass instead of filtering
+        # the frame once per category
+        category_frames = df_stacked.partition_by(["Category"], as_dict=True)
+
+        # Collect the traces and build the figure once
+        traces = []
 
         # For each category, add a trace to the stacked bar with custom hover text
-        for category in unique_categories:
+        for (category,), cat_df in category_frames.items():
+            month_values = dict(
+                cat_df.group_by("Month").agg(pl.col(value_column).sum()).iter_rows()
+            )
             values = []
             hover_texts = []
 
             # Create values and hover texts for each month for this category
-            for month in months:
-                # Get this category's value for the month
-                cat_value = 0
-                cat_percentage = 0
-                month_total = monthly_data[month]["total"]
-
-                for cat in monthly_data[month]["categories"]:
-                    if cat["category"] == category:
-                        cat_value = cat["value"]
-                        cat_percentage = cat["percentage"]
-                        break
+            for month, month_raw in zip(months, all_months):
+                month_total = month_totals[month_raw]
+                cat_value = month_values.get(month_raw, 0)
+
+                # Only include categories with values
+                if cat_value > 0:
+                    cat_percentage = (
+                        (cat_value / month_total * 100) if month_total > 0 else 0
+                    )
+                else:
+                    cat_value = 0
+                    cat_percentage = 0
 
                 values.append(cat_value)
 
@@ -370,7 +351,7 @@ class ChartFactory:
 
             # Only add trace if there are values
             if sum(values) > 0:
-                fig.add_trace(
+                traces.append(
                     go.Bar(
                         x=months,
                         y=values,
@@ -383,6 +364,8 @@ class ChartFactory:
                     )
                 )
 
+        fig = go.Figure(data=traces)
+
         # Style the figure
         fig = self.chart_styler.apply_styling(fig, title)
 
@@ -466,44 +449,44 @@ class ChartFactory:
             )
 
         # Get all months and categories
-        months = sorted(df_risparmio["Month"].unique().to_list())
-        categories = sorted(df_risparmio["Category"].unique().to_list())
+        months_frame = df_risparmio.select(pl.col("Month").unique().sort())
+        categories_frame = df_risparmio.select(pl.col("Category").unique().sort())
+        months = months_frame["Month"].to_list()
+        categories = categories_frame["Category"].to_list()
 
         # Get consistent colors for savings categories
-        category_colors = {
-            cat: self.category_mapper.get_savings_category_color(cat)
-            for cat in categories
-        }
-
-        # Calculate end-of-month balance for each category
-        monthly_balances = {}
-        category_balances = {cat: 0.0 for cat in categories}
-
-        for month in months:
-            # Update balances for each category based on this month's transactions
-            month_data = df_risparmio.filter(pl.col("Month") == month)
-
-            for category in categories:
-                # Calculate net change for this category in this month
-                cat_data = month_data.filter(pl.col("Category") == category)
-                if len(cat_data) > 0:
-                    net_change = cat_data["Value"].sum()
-                    category_balances[category] += net_change
+        category_colors = dict(
+            zip(categories, self.category_mapper.get_savings_colors(categories))
+        )
 
-            # Store a copy of the current balances for this month
-            monthly_balances[month] = category_balances.copy()
+        # Calculate end-of-month balance for each category: net change of every
+        # (month, category) pair, zero when there were no transactions, then a
+        # running total per category over the month-ordered grid
+        monthly_changes = df_risparmio.group_by(["Month", "Category"]).agg(
+            pl.col("Value").sum().alias("NetChange")
+        )
+        monthly_balances = (
+            months_frame.join(categories_frame, how="cross")
+            .join(monthly_changes, on=["Month", "Category"], how="left")
+            .with_columns(
+                pl.col("NetChange")
+                .fill_null(0.0)
+                .cum_sum()
+                .over("Category")
+                .alias("Balance")
+            )
+        )
 
         # Create figure with traces for each category
-        fig = go.Figure()
-
-        for category in categories:
-            x_values = months
-            y_values = [monthly_balances[month][category] for month in months]
+        traces = []
 
-            fig.add_trace(
+        for (category,), cat_balances in monthly_balances.partition_by(
+            ["Category"], as_dict=True
+        ).items():
+            traces.append(
                 go.Scatter(
-                    x=x_values,
-                    y=y_values,
+                    x=months,
+                    y=cat_balances["Balance"].to_numpy(),
                     name=category,
                     mode="lines",
                     line=dict(width=0.5, color=category_colors[category]),
@@ -513,6 +496,8 @@ class ChartFactory:
                 )
             )
 
+        fig = go.Figure(data=traces)
+
         # Style the figure
         fig = self.chart_styler.apply_styling(
             fig, "Savings Categories Balance Over Time"
@@ -591,11 +576,8 @@ class ChartFactory:
         end_month_display = end_date.strftime("%B %Y")
         self.logger.info("Generating savings breakdown as of: %s", end_month)
 
-        # Get all months up to and including the end month
-        all_months = sorted(df_risparmio["Month"].unique().to_list())
-        relevant_months = [month for month in all_months if month <= end_month]
-
-        if not relevant_months:
+        # Check there is data up to and including the end month
+        if df_risparmio["Month"].min() > end_month:
             fig = go.Figure()
             fig.update_layout(
                 title=f"Savings Breakdown as of {end_month_display} - No Data",
@@ -613,32 +595,27 @@ class ChartFactory:
             )
             return fig
 
-        # Get all savings categories
-        categories = df_risparmio["Category"].unique().to_list()
-
-        # Calculate category balances as of the end month
-        category_balances = {cat: 0.0 for cat in categories}
-
-        # Process all transactions up to and including the end month
-        for category in categories:
-            category_data = df_risparmio.filter(
-                (pl.col("Month").is_in(relevant_months))
-                & (pl.col("Category") == category)
-            )
-            if len(category_data) > 0:
-                net_change = category_data["Value"].sum()
-                category_balances[category] += net_change
+        # Calculate category balances as of the end month, fusing the filter on
+        # all transactions up to and including the end month with the aggregation
+        category_balances = dict(
+            df_risparmio.lazy()
+            .filter(pl.col("Month") <= end_month)
+            .group_by("Category", maintain_order=True)
+            .agg(pl.col("Value").sum())
+            .collect()
+            .iter_rows()
+        )
 
         # Filter out categories with zero or negative balances for the pie chart
         labels = []
         values = []
-        colors = []
 
         for category, balance in category_balances.items():
             if balance > 0:
                 labels.append(category)
                 values.append(balance)
-                colors.append(self.category_mapper.get_savings_category_color(category))
+
+        colors = self.category_mapper.get_savings_colors(labels)
 
         # If we have no positive values, display a message
         if not values or sum(values) == 0:
@@ -739,8 +716,15 @@ class ChartFactory:
             )
             return fig
 
-        # Merge income and savings data by month
-        df_merged = df_monthly_summary.join(df_savings_metrics, on="Month", how="inner")
+        # Merge income and savings data by month, keeping the running total of
+        # the month before each one for the first month's change
+        df_merged = df_monthly_summary.join(
+            df_savings_metrics.sort("Month").with_columns(
+                pl.col("TotalSavings").shift(1).alias("PreviousTotal")
+            ),
+            on="Month",
+            how="inner",
+        )
 
         # Filter out months with no income (cannot calculate rate)
         df_merged = df_merged.filter(pl.col("Income") > 0)
@@ -763,32 +747,22 @@ class ChartFactory:
             )
             return fig
 
-        # Get months and income
-        months = df_merged["Month"].to_list()
-        total_savings = df_merged["TotalSavings"].to_list()
-        income = df_merged["Income"].to_list()
+        # Monthly savings amounts are the differences between running totals,
+        # the first month is measured against the month before it when there is
+        # one. The rate divides by income, which is positive after the filter
+        df_merged = df_merged.with_columns(
+            pl.col("TotalSavings")
+            .diff()
+            .fill_null(pl.col("TotalSavings") - pl.col("PreviousTotal"))
+            .fill_null(0)
+            .alias("MonthlySavings")
+        ).with_columns(
+            (pl.col("MonthlySavings") / pl.col("Income") * 100).alias("SavingsRate")
+        )
 
-        # Calculate monthly total savings amounts (for percentage calculation)
-        monthly_savings_totals = []
-        for i, month in enumerate(months):
-            if i == 0:
-                # First month: Calculate from the beginning of data
-                all_savings = df_savings_metrics.filter(pl.col("Month") <= months[0])
-                if len(all_savings) > 1:
-                    prev_total = all_savings["TotalSavings"][-2]
-                    monthly_amount = total_savings[i] - prev_total
-                else:
-                    monthly_amount = 0
-            else:
-                # Subsequent months: difference from previous month
-                monthly_amount = total_savings[i] - total_savings[i - 1]
-            monthly_savings_totals.append(monthly_amount)
-
-        # Calculate savings rate as percentage
-        savings_rates = [
-            (saved / inc * 100) if inc > 0 else 0
-            for saved, inc in zip(monthly_savings_totals, income)
-        ]
+        months = df_merged["Month"].to_list()
+        monthly_savings_totals = df_merged["MonthlySavings"].to_list()
+        savings_rates = df_merged["SavingsRate"].to_list()
 
         # Calculate savings by category for stacked bar
         category_data = {}
@@ -804,26 +778,20 @@ class ChartFactory:
                 pl.col("CategoryType") == "Risparmio"
             )
 
-            # Get all unique categories
-            all_categories = df_risparmio["Category"].unique().to_list()
+            # Aggregate the monthly amounts of every category in a single pass
+            category_month_values: Dict[str, Dict[str, float]] = {}
+            for category, month, value in (
+                df_risparmio.group_by(["Category", "Month"], maintain_order=True)
+                .agg(pl.col("Value").sum())
+                .iter_rows()
+            ):
+                category_month_values.setdefault(category, {})[month] = value
 
             # For each category, calculate monthly amounts
-            for category in all_categories:
-                category_monthly_values = []
-
-                for month in months:
-                    # Get savings for this month and category
-                    month_cat_savings = df_risparmio.filter(
-                        (pl.col("Month") == month) & (pl.col("Category") == category)
-                    )
-
-                    if len(month_cat_savings) > 0:
-                        monthly_value = month_cat_savings["Value"].sum()
-                        category_monthly_values.append(monthly_value)
-                    else:
-                        category_monthly_values.append(0)
-
-                category_data[category] = category_monthly_values
+            for category, month_values in category_month_values.items():
+                category_data[category] = [
+                    month_values.get(month, 0) for month in months
+                ]
         else:
             # No detailed savings data, create single category
             category_data["Savings"] = monthly_savings_totals
@@ -893,15 +861,15 @@ class ChartFactory:
         # Remove last <br> and add closing tag
         hover_template = "".join(hover_template_parts)[:-4] + "<extra></extra>"
 
-        # Create figure with secondary y-axis
-        fig = go.Figure()
+        # Collect the traces of the figure with secondary y-axis
+        traces = []
 
         # Add stacked bars for each savings category (primary y-axis) first
         for category, values in category_data.items():
             safe_key = category_to_safe_key[category]  # Get the safe key
             cat_color = category_colors_dict[safe_key]  # Use safe key for color lookup
 
-            fig.add_trace(
+            traces.append(
                 go.Bar(
                     x=display_months,
                     y=values,
@@ -917,7 +885,7 @@ class ChartFactory:
             )
 
         # Add savings rate line (secondary y-axis) last so it renders on top
-        fig.add_trace(
+        traces.append(
             go.Scatter(
                 x=display_months,
                 y=savings_rates,
@@ -931,6 +899,8 @@ class ChartFactory:
             )
         )
 
+        fig = go.Figure(data=traces)
+
         # Apply styling
         fig = self.chart_styler.apply_styling(fig, "Monthly Savings Rate")
 
@@ -1000,11 +970,8 @@ class ChartFactory:
         # Get the end month in "YYYY-MM" format
         end_month = end_date.strftime("%Y-%m")
 
-        # Get all months up to and including the end month
-        all_months = sorted(df_savings["Month"].unique().to_list())
-        relevant_months = [month for month in all_months if month <= end_month]
-
-        if not relevant_months:
+        # Check there is data up to and including the end month
+        if df_savings["Month"].min() > end_month:
             fig = go.Figure()
             fig.update_layout(
                 title="Allocation Breakdown - No Data",
@@ -1024,7 +991,7 @@ class ChartFactory:
 
         # Filter only Allocations (Accantonamento)
         df_filtered = df_savings.filter(
-            (pl.col("Month").is_in(relevant_months))
+            (pl.col("Month") <= end_month)
             & (pl.col("CategoryType") == "Accantonamento")
         )
 
@@ -1076,12 +1043,10 @@ class ChartFactory:
         df_grouped = df_grouped.sort("Balance", descending=True)
 
         categories = df_grouped["Category"].to_list()
-        balances = df_grouped["Balance"].to_list()
+        balances = df_grouped["Balance"].to_numpy()
 
         # Get colors for categories using the category mapper
-        colors = [
-            self.category_mapper.get_savings_category_color(cat) for cat in categories
-        ]
+        colors = self.category_mapper.get_savings_colors(categories)
 
         # Create vertical bar chart
         fig = go.Figure()
@@ -1214,7 +1179,7 @@ class ChartFactory:
         fig.add_trace(
             go.Bar(
                 x=months,
-                y=df_monthly_summary["Income"],
+                y=df_monthly_summary["Income"].to_numpy(),
                 name="Income",
                 marker_color=income_color,
                 marker_line_color=income_color,
@@ -1229,7 +1194,7 @@ class ChartFactory:
         fig.add_trace(
             go.Bar(
                 x=months,
-                y=df_monthly_summary["Expenses"],
+                y=df_monthly_summary["Expenses"].to_numpy(),
                 name="Expenses",
                 marker_color=expense_color,
                 marker_line_color=expense_color,
@@ -1244,7 +1209,7 @@ class ChartFactory:
         fig.add_trace(
             go.Scatter(
                 x=months,
-                y=df_monthly_summary["Balance"],
+                y=df_monthly_summary["Balance"].to_numpy(),
                 name="Balance",
                 line=dict(color=balance_color, width=3),
                 mode="lines+markers",
@@ -1302,8 +1267,8 @@ class ChartFactory:
         # Add total savings line
         fig.add_trace(
             go.Scatter(
-                x=df_savings_metrics["Month"].to_list(),
-                y=df_savings_metrics["TotalSavings"].to_list(),
+                x=df_savings_metrics["Month"].to_numpy(),
+                y=df_savings_metrics["TotalSavings"].to_numpy(),
                 name="Total Savings",
                 line=dict(color=self.color_theme["savings"]["total"], width=4),
             )
@@ -1312,8 +1277,8 @@ class ChartFactory:
         # Add total allocations line
         fig.add_trace(
             go.Scatter(
-                x=df_savings_metrics["Month"].to_list(),
-                y=df_savings_metrics["TotalAllocated"].to_list(),
+                x=df_savings_metrics["Month"].to_numpy(),
+                y=df_savings_metrics["TotalAllocated"].to_numpy(),
                 name="Total Allocations",
                 line=dict(
                     color=self.color_theme["savings"]["allocation"],
@@ -1326,8 +1291,8 @@ class ChartFactory:
         # Add total spent line
         fig.add_trace(
             go.Scatter(
-                x=df_savings_metrics["Month"].to_list(),
-                y=df_savings_metrics["TotalSpent"].to_list(),
+                x=df_savings_metrics["Month"].to_numpy(),
+                y=df_savings_metrics["TotalSpent"].to_numpy(),
                 name="Total Spent",
                 line=dict(
                     color=self.color_theme["savings"]["spent"], width=3, dash="dot"
@@ -1361,22 +1326,14 @@ class ChartFactory:
                 "No savings transactions available for the selected period."
             )
 
-        # Create a copy of the dataframe with sorted data
-        df_table = df_savings.sort("Date", descending=True)
-
-        # Format date and numeric columns for display
-        df_table = df_table.with_columns(
-            [
-                pl.col("Date").dt.strftime("%d/%m/%Y").alias("Date"),
-                pl.col("Value")
-                .map_elements(lambda x: f"€{x:.2f}", return_dtype=pl.Utf8)
-                .alias("Amount"),
-            ]
-        )
-
-        # Select and rename columns for display
-        df_display = df_table.select(
-            ["Date", "Description", "Category", "CategoryType", "Value"]
+        # Sort newest first, format the date column for display and select the
+        # displayed columns
+        df_display = df_savings.sort("Date", descending=True).select(
+            pl.col("Date").dt.strftime("%d/%m/%Y"),
+            "Description",
+            "Category",
+            "CategoryType",
+            "Value",
         )
 
         # Convert directly to records for Dash without using pandas
@@ -1464,8 +1421,8 @@ class ChartFactory:
             },
         }
 
-        # Create grouped bar chart
-        fig = go.Figure()
+        # Collect the traces of the grouped bar chart
+        traces = []
 
         categories = ["Income", "Expenses", "Balance"]
         colors = [
@@ -1483,7 +1440,7 @@ class ChartFactory:
             zip(categories, means, medians, colors)
         ):
             # Add average bar
-            fig.add_trace(
+            traces.append(
                 go.Bar(
                     name="Average" if i == 0 else None,
                     x=[cat],
@@ -1501,7 +1458,7 @@ class ChartFactory:
             )
 
             # Add median bar
-            fig.add_trace(
+            traces.append(
                 go.Bar(
                     name="Median" if i == 0 else None,
                     x=[cat],
@@ -1519,6 +1476,9 @@ class ChartFactory:
                 )
             )
 
+        # Create grouped bar chart
+        fig = go.Figure(data=traces)
+
         fig = self.chart_styler.apply_styling(
             fig, "Monthly Statistics: Average vs Median"
         )
@@ -1594,12 +1554,9 @@ class ChartFactory:
 
         # Create complete grid of all months × all categories
         # This ensures missing month-category combinations are counted as 0
-        month_category_grid = []
-        for month in all_months:
-            for category in all_categories:
-                month_category_grid.append({"Month": month, "Category": category})
-
-        complete_grid = pl.DataFrame(month_category_grid)
+        complete_grid = all_months.to_frame().join(
+            all_categories.to_frame(), how="cross"
+        )
 
         # Join with actual data and fill nulls with 0
         monthly_by_category = complete_grid.join(
@@ -1627,8 +1584,8 @@ class ChartFactory:
             category_stats = category_stats.head(top_n)
 
         categories = category_stats["Category"].to_list()
-        means = category_stats["Mean"].to_list()
-        medians = category_stats["Median"].to_list()
+        means = category_stats["Mean"].to_numpy()
+        medians = category_stats["Median"].to_numpy()
         q1s = category_stats["Q1"].to_list()
         q3s = category_stats["Q3"].to_list()
 
@@ -2098,7 +2055,6 @@ class ChartFactory:
             return fig
 
         last_month = months[-1]
-        current_month_data = df_processed.filter(pl.col("Month") == last_month)
 
         # Get all unique categories
         all_categories = df_processed["Category"].unique()
@@ -2110,33 +2066,26 @@ class ChartFactory:
 
         # Create complete grid of all months × all categories
         # This ensures missing month-category combinations are counted as 0
-        month_category_grid = []
-        for month in months:
-            for category in all_categories:
-                month_category_grid.append({"Month": month, "Category": category})
-
-        complete_grid = pl.DataFrame(month_category_grid)
+        complete_grid = pl.DataFrame({"Month": months}).join(
+            all_categories.to_frame(), how="cross"
+        )
 
         # Join with actual data and fill nulls with 0
         monthly_by_category = complete_grid.join(
             monthly_by_category, on=["Month", "Category"], how="left"
         ).with_columns(pl.col("MonthlyTotal").fill_null(0))
 
-        # Calculate median (typical) for each category
-        typical_by_category = monthly_by_category.group_by("Category").agg(
-            pl.col("MonthlyTotal").median().alias("TypicalAmount")
+        # Calculate median (typical) and current month total for each category
+        # in one aggregation, the grid already holds every category so no join
+        # is needed to line them up
+        comparison = monthly_by_category.group_by("Category").agg(
+            pl.col("MonthlyTotal").median().alias("TypicalAmount"),
+            pl.col("MonthlyTotal")
+            .filter(pl.col("Month") == last_month)
+            .sum()
+            .alias("CurrentAmount"),
         )
 
-        # Get current month totals
-        current_by_category = current_month_data.group_by("Category").agg(
-            pl.col("Value").sum().alias("CurrentAmount")
-        )
-
-        # Merge to compare
-        comparison = typical_by_category.join(
-            current_by_category, on="Category", how="outer"
-        ).fill_null(0)
-
         # Calculate percentage difference
         comparison = comparison.with_columns(
             [
@@ -2156,8 +2105,8 @@ class ChartFactory:
         )
 
         categories = comparison["Category"].to_list()
-        current_amounts = comparison["CurrentAmount"].to_list()
-        typical_amounts = comparison["TypicalAmount"].to_list()
+        current_amounts = comparison["CurrentAmount"].to_numpy()
+        typical_amounts = comparison["TypicalAmount"].to_numpy()
         percent_diffs = comparison["PercentDiff"].to_list()
 
         # Determine attention markers
@@ -145,8 +145,9 @@ class DataFrameProcessor:
             # Sanitize rows for DataFrame creation
             sanitized_rows = self._sanitize_rows(valid_rows)
 
-            # Create DataFrame with strings to avoid type inference issues
-            df = pl.DataFrame(data=sanitized_rows, schema=columns)
+            # Create DataFrame with strings to avoid type inference issues, the
+            # rows are declared as rows so no orientation has to be inferred
+            df = pl.DataFrame(data=sanitized_rows, schema=columns, orient="row")
 
             # Clean the dataframe (handle type conversions)
             df = self._clean_dataframe(df, sheet_name)
@@ -314,11 +315,15 @@ class DataFrameProcessor:
         # Find the standard name for this sheet
         sheet_type = self._get_sheet_type(sheet_name)
 
+        # Read the string columns from the schema once, the first two steps
+        # keep the dtypes of the raw sheet
+        string_cols = [col for col, dtype in df.schema.items() if dtype == pl.Utf8]
+
         # First, replace empty strings with None in all columns to standardize missing values
-        df = self._replace_empty_strings(df)
+        df = self._replace_empty_strings(df, string_cols)
 
         # Process date columns
-        df = self._process_date_columns(df)
+        df = self._process_date_columns(df, string_cols)
 
         # Process monetary values if found
         df = self._clean_monetary_columns(df, sheet_type)
@@ -348,32 +353,38 @@ class DataFrameProcessor:
         self.logger.warning(f"Could not determine sheet type for {sheet_name}")
         return None
 
-    def _process_date_columns(self, df: pl.DataFrame) -> pl.DataFrame:
+    def _process_date_columns(
+        self, df: pl.DataFrame, string_cols: List[str]
+    ) -> pl.DataFrame:
         """
         Process date columns in the DataFrame.
 
         Args:
             df: DataFrame to process
+            string_cols: Names of the string columns of the DataFrame
 
         Returns:
             pl.DataFrame: DataFrame with processed date columns
         """
         date_column_candidates = self.config.get("date_column_candidates")
 
-        for col in df.columns:
-            if col in date_column_candidates:
-                try:
-                    # Try to convert to date format
-                    self.logger.debug(f"Converting column {col} to date format")
-                    df = df.with_columns(
-                        pl.col(col)
-                        .str.strptime(pl.Date, "%Y-%m-%d", strict=False)
-                        .alias(col)
-                    )
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to convert column {col} to date: {str(e)}"
-                    )
+        # Dispatch on the schema, only string candidates need parsing
+        date_cols = [col for col in string_cols if col in date_column_candidates]
+        if not date_cols:
+            return df
+
+        try:
+            # Convert every date column to date format in one pass
+            self.logger.debug(
+                f"Converting columns {', '.join(date_cols)} to date format"
+            )
+            df = df.with_columns(
+                pl.col(date_cols).str.strptime(pl.Date, "%Y-%m-%d", strict=False)
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to convert columns {', '.join(date_cols)} to date: {str(e)}"
+            )
 
         return df
 
@@ -418,26 +429,28 @@ class DataFrameProcessor:
 
         return df
 
-    def _replace_empty_strings(self, df: pl.DataFrame) -> pl.DataFrame:
+    def _replace_empty_strings(
+        self, df: pl.DataFrame, string_cols: List[str]
+    ) -> pl.DataFrame:
         """
         Replace empty strings with None in all string columns.
 
         Args:
             df: DataFrame to clean
+            string_cols: Names of the string columns of the DataFrame
 
         Returns:
             pl.DataFrame: DataFrame with empty strings replaced
         """
-        for col in df.columns:
-            if df[col].dtype == pl.Utf8:
-                df = df.with_columns(
-                    pl.when(pl.col(col) == "")
-                    .then(None)
-                    .otherwise(pl.col(col))
-                    .alias(col)
-                )
+        if not string_cols:
+            return df
 
-        return df
+        return df.with_columns(
+            [
+                pl.when(pl.col(col) == "").then(None).otherwise(pl.col(col)).alias(col)
+                for col in string_cols
+            ]
+        )
 
     def _drop_empty_rows(self, df: pl.DataFrame) -> pl.DataFrame:
         """
@@ -449,16 +462,11 @@ class DataFrameProcessor:
         Returns:
             pl.DataFrame: DataFrame with empty rows dropped
         """
-        string_cols = [col for col in df.columns if df[col].dtype == pl.Utf8]
-        if string_cols:
+        if pl.Utf8 in df.schema.values():
             rows_before = len(df)
-            df = df.filter(
-                ~pl.fold(
-                    True,
-                    lambda acc, s: acc & (s.is_null() | (s == "")),
-                    [pl.col(c) for c in string_cols],
-                )
-            )
+            # A row is empty when every string column is null or empty, checked
+            # natively across all string columns with a dtype selector
+            df = df.filter(~pl.all_horizontal(pl.col(pl.Utf8).fill_null("") == ""))
             rows_dropped = rows_before - len(df)
             if rows_dropped > 0:
                 self.logger.info(
@@ -541,16 +549,20 @@ class FileHandler:
             if directory:
                 os.makedirs(directory, exist_ok=True)
 
-            # Round all float columns to 2 decimal places before saving
-            df_to_save = df.clone()
-            for col in df.columns:
-                if df[col].dtype in (pl.Float32, pl.Float64):
-                    df_to_save = df_to_save.with_columns(
-                        pl.col(col).round(2).alias(col)
-                    )
+            # Round all float columns to 2 decimal places as part of a lazy
+            # plan, so the rounded copy is streamed to disk in batches
+            lf_to_save = df.lazy().with_columns(pl.col(pl.Float32, pl.Float64).round(2))
 
             # Save to CSV with proper floating point precision
-            df_to_save.write_csv(path, float_precision=2)
+            try:
+                lf_to_save.sink_csv(path, float_precision=2)
+            except (
+                pl.exceptions.InvalidOperationError,
+                pl.exceptions.ComputeError,
+            ):
+                # The streaming engine doesn't support every plan, fall back to
+                # collecting it first
+                lf_to_save.collect().write_csv(path, float_precision=2)
             self.logger.info(f"Successfully saved DataFrame to {path}")
 
         except Exception as e:
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import polars as pl  # pylint: disable=import-error
-from pydantic import BaseModel  # pylint: disable=import-error
+from pydantic import BaseModel, ConfigDict  # pylint: disable=import-error
 
 
 @dataclass
@@ -75,10 +75,7 @@ class FinancialRecord(BaseModel):
     Category: str
     Value: float
 
-    class Config:
-        """Pydantic configuration."""
-
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class SavingsRecord(FinancialRecord):
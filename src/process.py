@@ -11,33 +11,14 @@ import logging
 import os
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 import polars as pl
-import pydantic
-from pydantic import BaseModel, Field, validator
 
 from config import Config
 
-
-class FinancialRecord(BaseModel):
-    """Base model for financial records validation."""
-
-    Date: datetime
-    Description: str
-    Category: str
-    Value: float
-
-    class Config:
-        """Pydantic configuration."""
-
-        arbitrary_types_allowed = True
-
-
-class SavingsRecord(FinancialRecord):
-    """Model for savings records validation."""
-
-    CategoryType: str
+# Frame type accepted by the transformation steps, eager or lazy
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
 
 
 @dataclass
@@ -63,9 +44,23 @@ class SchemaValidator:
     Validates and converts financial data to standard schema.
 
     This class is responsible for validating raw data against defined schemas
-    and converting it to standardized formats.
+    and converting it to standardized formats. Every schema column must be
+    present, the columns are cast to their schema types in a single pass and
+    rows with a missing or unconvertible value in any column are rejected.
     """
 
+    # Output schemas, in the column order of the processed datasets
+    EXPENSE_INCOME_SCHEMA: Dict[str, Any] = {
+        "Date": pl.Datetime,
+        "Description": pl.Utf8,
+        "Category": pl.Utf8,
+        "Value": pl.Float64,
+    }
+    SAVINGS_SCHEMA: Dict[str, Any] = {**EXPENSE_INCOME_SCHEMA, "CategoryType": pl.Utf8}
+
+    # Number of failing rows reported in the validation summary
+    MAX_LOGGED_FAILURES = 10
+
     def __init__(self, logger: logging.Logger):
         """
         Initialize the schema validator.
@@ -75,78 +70,104 @@ class SchemaValidator:
         """
         self.logger = logger.getChild("SchemaValidator")
 
-    def validate_expense_income(
-        self, df: pl.DataFrame
+    def _log_failures(
+        self, errors: List[str], failed_rows: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Log a single summary of the rows that failed validation.
+
+        Args:
+            errors: Validation errors collected for every failing row
+            failed_rows: First failing rows, up to MAX_LOGGED_FAILURES
+        """
+        if not errors:
+            return
+
+        self.logger.warning(
+            f"{len(errors)} rows failed validation, "
+            f"showing the first {len(failed_rows)}"
+        )
+        for row, error in zip(failed_rows, errors):
+            self.logger.warning(f"Validation error for row: {row}, error: {error}")
+
+    def _validate_schema(
+        self, df: pl.DataFrame, schema: Dict[str, Any]
     ) -> Tuple[pl.DataFrame, List[str]]:
         """
-        Validate expense/income data against schema.
+        Cast the schema columns and drop the rows that do not fit the schema.
 
         Args:
-            df: Raw expense or income DataFrame
+            df: Raw DataFrame to validate
+            schema: Output schema, every column is required
 
         Returns:
             Tuple containing:
                 - pl.DataFrame: Validated DataFrame
                 - List[str]: List of validation errors
         """
-        errors = []
-        validated_rows = []
-
-        for row in df.iter_rows(named=True):
-            try:
-                # Convert to dict and validate with pydantic
-                validated = FinancialRecord(
-                    Date=row["Date"],
-                    Description=row["Description"],
-                    Category=row["Category"],
-                    Value=float(row["Value"]),
-                )
-                validated_rows.append(validated.dict())
-            except pydantic.ValidationError as e:
-                errors.append(f"Row validation error: {e}")
-                self.logger.warning(f"Validation error for row: {row}, error: {e}")
+        missing_columns = [name for name in schema if name not in df.columns]
+        if missing_columns:
+            error = f"Missing required columns: {missing_columns}"
+            self.logger.error(error)
+            return pl.DataFrame(), [error]
+
+        # Cast every column in one pass, values that cannot be converted become
+        # null and, like missing values, make the row invalid
+        casted = df.select(
+            pl.col(name).cast(dtype, strict=False) for name, dtype in schema.items()
+        )
+        is_invalid = casted.select(
+            pl.any_horizontal(pl.col(list(schema)).is_null())
+        ).to_series()
+
+        # Only the null mask of the rejected rows crosses into Python, as plain
+        # tuples of booleans, to name the offending fields
+        invalid_fields = casted.filter(is_invalid).select(pl.all().is_null())
+        errors = [
+            "Row validation error: missing or invalid "
+            + ", ".join(name for name, is_null in zip(schema, row) if is_null)
+            for row in invalid_fields.iter_rows()
+        ]
+        self._log_failures(
+            errors, df.filter(is_invalid).head(self.MAX_LOGGED_FAILURES).to_dicts()
+        )
 
-        if not validated_rows:
+        validated = casted.filter(~is_invalid)
+        if validated.is_empty():
             self.logger.error("No valid rows after validation")
             return pl.DataFrame(), errors
 
-        return pl.DataFrame(validated_rows), errors
+        return validated, errors
 
-    def validate_savings(self, df: pl.DataFrame) -> Tuple[pl.DataFrame, List[str]]:
+    def validate_expense_income(
+        self, df: pl.DataFrame
+    ) -> Tuple[pl.DataFrame, List[str]]:
         """
-        Validate savings data against schema.
+        Validate expense/income data against schema.
 
         Args:
-            df: Raw savings DataFrame
+            df: Raw expense or income DataFrame
 
         Returns:
             Tuple containing:
                 - pl.DataFrame: Validated DataFrame
                 - List[str]: List of validation errors
         """
-        errors = []
-        validated_rows = []
+        return self._validate_schema(df, self.EXPENSE_INCOME_SCHEMA)
 
-        for row in df.iter_rows(named=True):
-            try:
-                # Convert to dict and validate with pydantic
-                validated = SavingsRecord(
-                    Date=row["Date"],
-                    Description=row["Description"],
-                    Category=row["Category"],
-                    CategoryType=row["CategoryType"],
-                    Value=float(row["Value"]),
-                )
-                validated_rows.append(validated.dict())
-            except pydantic.ValidationError as e:
-                errors.append(f"Row validation error: {e}")
-                self.logger.warning(f"Validation error for row: {row}, error: {e}")
+    def validate_savings(self, df: pl.DataFrame) -> Tuple[pl.DataFrame, List[str]]:
+        """
+        Validate savings data against schema.
 
-        if not validated_rows:
-            self.logger.error("No valid rows after validation")
-            return pl.DataFrame(), errors
+        Args:
+            df: Raw savings DataFrame
 
-        return pl.DataFrame(validated_rows), errors
+        Returns:
+            Tuple containing:
+                - pl.DataFrame: Validated DataFrame
+                - List[str]: List of validation errors
+        """
+        return self._validate_schema(df, self.SAVINGS_SCHEMA)
 
 
 class DataTransformer:
@@ -169,129 +190,187 @@ class DataTransformer:
         self.logger = logger.getChild("DataTransformer")
 
     def standardize_date_format(
-        self, df: pl.DataFrame, date_col: str = "Date"
-    ) -> pl.DataFrame:
+        self, df: FrameT, date_col: str = "Date", date_format: Optional[str] = None
+    ) -> FrameT:
         """
         Standardize date format in the DataFrame.
 
         Args:
-            df: DataFrame to process
+            df: DataFrame or LazyFrame to process
             date_col: Name of the date column
+            date_format: Known format of string dates, skips format detection
 
         Returns:
-            pl.DataFrame: DataFrame with standardized date column
+            FrameT: DataFrame or LazyFrame with standardized date column
         """
-        if date_col not in df.columns:
+        schema = df.schema
+        if date_col not in schema:
             self.logger.warning(f"Date column '{date_col}' not found in DataFrame")
             return df
 
+        # Already typed frames, e.g. when re-processing, need no conversion
+        dtype = schema[date_col]
+        if dtype == pl.Datetime:
+            return df
+
         # Handle different date formats
-        if df[date_col].dtype == pl.Utf8:
-            try:
-                # Try multiple date formats
-                if any(
-                    row and "/" in row for row in df[date_col] if isinstance(row, str)
-                ):
-                    return df.with_columns(
-                        pl.col(date_col)
-                        .str.strptime(pl.Datetime, "%d/%m/%y")
-                        .alias(date_col)
-                    )
-                elif any(
-                    row and "-" in row for row in df[date_col] if isinstance(row, str)
-                ):
-                    return df.with_columns(
-                        pl.col(date_col)
-                        .str.strptime(pl.Datetime, "%Y-%m-%d")
-                        .alias(date_col)
-                    )
-                else:
+        if dtype == pl.Utf8 and date_format:
+            # The source format is known, parse with it and only fall back to
+            # the general conversion for values that don't match
+            return df.with_columns(
+                pl.coalesce(
+                    pl.col(date_col).str.strptime(
+                        pl.Datetime, date_format, strict=False
+                    ),
+                    pl.col(date_col).str.to_datetime(strict=False),
+                ).alias(date_col)
+            )
+        elif dtype == pl.Utf8:
+            # Try every supported format in one native pass, each value keeps
+            # the first format that parses it
+            return df.with_columns(
+                pl.coalesce(
+                    pl.col(date_col).str.strptime(
+                        pl.Datetime, "%d/%m/%y", strict=False
+                    ),
+                    pl.col(date_col).str.strptime(
+                        pl.Datetime, "%Y-%m-%d", strict=False
+                    ),
                     # General conversion
-                    return df.with_columns(
-                        pl.col(date_col).str.to_datetime().alias(date_col)
-                    )
-            except Exception as e:
-                self.logger.error(f"Error converting date column: {e}")
-                # Fallback to general conversion
-                return df.with_columns(
-                    pl.col(date_col).str.to_datetime().alias(date_col)
-                )
-        elif df[date_col].dtype == pl.Date:
+                    pl.col(date_col).str.to_datetime(strict=False),
+                ).alias(date_col)
+            )
+        elif dtype == pl.Date:
             # Convert Date to Datetime
             return df.with_columns(pl.col(date_col).cast(pl.Datetime).alias(date_col))
 
         return df
 
     def normalize_categories(
-        self, df: pl.DataFrame, valid_categories: List[str], default_category: str
-    ) -> pl.DataFrame:
+        self,
+        df: FrameT,
+        valid_categories: Union[List[str], pl.Series],
+        default_category: str,
+    ) -> FrameT:
         """
         Normalize categories in the DataFrame.
 
         Args:
-            df: DataFrame to process
-            valid_categories: List of valid category names
+            df: DataFrame or LazyFrame to process
+            valid_categories: Valid category names, as a list or a prebuilt Series
             default_category: Default category to use for invalid categories
 
         Returns:
-            pl.DataFrame: DataFrame with normalized categories
+            FrameT: DataFrame or LazyFrame with normalized categories
         """
         if "Category" not in df.columns:
             self.logger.warning("No Category column found in DataFrame")
             return df
 
-        # Check for null categories
-        null_count = df.filter(pl.col("Category").is_null()).height
-        if null_count > 0:
-            self.logger.warning(
-                f"Found {null_count} records with null categories. Using default: {default_category}"
+        # An Enum Category column whose categories are all known has already
+        # been normalized and encoded, skip the string membership check
+        category_dtype = df.schema["Category"]
+        if isinstance(category_dtype, pl.Enum) and set(
+            category_dtype.categories
+        ) <= set(valid_categories) | {default_category}:
+            return df
+
+        valid_set = (
+            valid_categories
+            if isinstance(valid_categories, pl.Series)
+            else pl.Series(valid_categories, dtype=pl.Utf8)
+        )
+
+        # Build the null and invalid predicates once, the counts and the
+        # replacement below share them
+        is_null = pl.col("Category").is_null()
+        is_invalid = ~pl.col("Category").is_in(valid_set)
+
+        # Count null and invalid categories in a single pass over the Category
+        # column, only when the warnings would be emitted
+        if self.logger.isEnabledFor(logging.WARNING):
+            null_count, invalid_count = (
+                df.lazy()
+                .select(
+                    is_null.sum().alias("null_count"),
+                    is_invalid.sum().alias("invalid_count"),
+                )
+                .collect()
+                .row(0)
             )
+            if null_count > 0:
+                self.logger.warning(
+                    f"Found {null_count} records with null categories. Using default: {default_category}"
+                )
+            if invalid_count > 0:
+                self.logger.warning(
+                    f"Found {invalid_count} records with invalid categories. Using default: {default_category}"
+                )
 
         # Replace null or invalid categories with default
         return df.with_columns(
-            pl.when(
-                pl.col("Category").is_null()
-                | ~pl.col("Category").is_in(valid_categories)
-            )
+            pl.when(is_null | is_invalid)
             .then(pl.lit(default_category))
             .otherwise(pl.col("Category"))
             .alias("Category")
         )
 
-    def clean_string_columns(self, df: pl.DataFrame) -> pl.DataFrame:
+    def encode_categories(
+        self,
+        df: FrameT,
+        valid_categories: Union[List[str], pl.Series],
+        default_category: str,
+    ) -> FrameT:
         """
-        Clean string columns by removing whitespace.
+        Store the Category column as an Enum of the known categories.
+
+        Grouping and comparing on the Enum works on integer codes instead of
+        hashing strings. Categories are ordered alphabetically so sorting on
+        the Enum matches sorting on the names.
 
         Args:
-            df: DataFrame to clean
+            df: DataFrame or LazyFrame with normalized categories
+            valid_categories: Valid category names, as a list or a Series
+            default_category: Default category used for invalid categories
 
         Returns:
-            pl.DataFrame: DataFrame with cleaned string columns
+            FrameT: DataFrame or LazyFrame with an Enum Category column
         """
-        # Get all string columns
-        string_cols = [col for col in df.columns if df[col].dtype == pl.Utf8]
-
-        if not string_cols:
+        if "Category" not in df.columns:
             return df
 
-        # Apply string cleaning to all string columns
-        return df.with_columns([pl.col(col).str.strip() for col in string_cols])
+        categories = sorted(set(valid_categories) | {default_category})
+        return df.with_columns(pl.col("Category").cast(pl.Enum(categories)))
 
-    def add_month_column(self, df: pl.DataFrame) -> pl.DataFrame:
+    def clean_string_columns(self, df: FrameT) -> FrameT:
         """
-        Add a Month column based on the Date column.
+        Clean string columns by removing whitespace.
 
         Args:
-            df: DataFrame to process
+            df: DataFrame or LazyFrame to clean
 
         Returns:
-            pl.DataFrame: DataFrame with Month column added
+            FrameT: DataFrame or LazyFrame with cleaned string columns
+        """
+        # Apply string cleaning to all string columns with a single dtype selector,
+        # a no-op when there are none
+        return df.with_columns(pl.col(pl.Utf8).str.strip_chars())
+
+    def add_month_start_column(self, df: FrameT) -> FrameT:
+        """
+        Add a MonthStart column with the first instant of each record's month.
+
+        Args:
+            df: DataFrame or LazyFrame to process
+
+        Returns:
+            FrameT: DataFrame or LazyFrame with MonthStart column added
         """
         if "Date" not in df.columns:
             self.logger.warning("No Date column found in DataFrame")
             return df
 
-        return df.with_columns(pl.col("Date").dt.strftime("%Y-%m").alias("Month"))
+        return df.with_columns(pl.col("Date").dt.truncate("1mo").alias("MonthStart"))
 
 
 class AnalyticsGenerator:
@@ -302,6 +381,23 @@ class AnalyticsGenerator:
     visualization and analysis from processed financial data.
     """
 
+    # Savings category types that count as allocations, anything else is savings
+    ALLOCATION_CATEGORY_TYPES: List[str] = ["Accantonamento"]
+
+    # Schemas of the savings outputs, shared by the empty fallbacks so they
+    # match the populated frames
+    SAVINGS_METRICS_SCHEMA: Dict[str, Any] = {
+        "Month": pl.Utf8,
+        "TotalSavings": pl.Float64,
+        "TotalAllocated": pl.Float64,
+        "TotalSpent": pl.Float64,
+    }
+    ALLOCATION_STATUS_SCHEMA: Dict[str, Any] = {
+        "Category": pl.Utf8,
+        "Type": pl.Utf8,
+        "Value": pl.Float64,
+    }
+
     def __init__(self, config: Config, logger: logging.Logger):
         """
         Initialize the analytics generator.
@@ -319,70 +415,100 @@ class AnalyticsGenerator:
         """Create the output folder if it doesn't exist."""
         os.makedirs(self.output_folder, exist_ok=True)
 
-    def monthly_summary(
+    @staticmethod
+    def _filter_date_range(
+        df: FrameT, start_date: Optional[datetime], end_date: Optional[datetime]
+    ) -> FrameT:
+        """
+        Keep the records between two dates, both included.
+
+        Args:
+            df: DataFrame or LazyFrame to filter
+            start_date: Start date, None when the frame is already restricted
+            end_date: End date, None when the frame is already restricted
+
+        Returns:
+            FrameT: Filtered DataFrame or LazyFrame
+        """
+        if start_date is None or end_date is None:
+            return df
+        return df.filter(pl.col("Date").is_between(start_date, end_date))
+
+    @staticmethod
+    def _month_start(df: Union[pl.DataFrame, pl.LazyFrame]) -> pl.Expr:
+        """
+        Get the month key of each record, reusing a precomputed MonthStart.
+
+        Args:
+            df: DataFrame with a Date column and optionally a MonthStart column
+
+        Returns:
+            pl.Expr: Expression for the MonthStart column
+        """
+        if "MonthStart" in df.columns:
+            return pl.col("MonthStart")
+        return pl.col("Date").dt.truncate("1mo").alias("MonthStart")
+
+    def monthly_summary_plan(
         self,
-        df_expenses: pl.DataFrame,
-        df_income: pl.DataFrame,
-        start_date: datetime,
-        end_date: datetime,
-    ) -> pl.DataFrame:
+        df_expenses: Union[pl.DataFrame, pl.LazyFrame],
+        df_income: Union[pl.DataFrame, pl.LazyFrame],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> pl.LazyFrame:
         """
-        Generate monthly summary of expenses and income.
+        Plan the monthly summary of expenses and income without collecting it.
 
         Args:
-            df_expenses: Processed expense DataFrame
-            df_income: Processed income DataFrame
-            start_date: Start date for the summary
-            end_date: End date for the summary
+            df_expenses: Processed expense DataFrame or LazyFrame
+            df_income: Processed income DataFrame or LazyFrame
+            start_date: Start date for the summary, None if already filtered
+            end_date: End date for the summary, None if already filtered
 
         Returns:
-            pl.DataFrame: Monthly summary DataFrame
+            pl.LazyFrame: Monthly summary plan
         """
-        # Filter by date range
-        expenses_filtered = df_expenses.filter(
-            (pl.col("Date") >= start_date) & (pl.col("Date") <= end_date)
-        )
-        income_filtered = df_income.filter(
-            (pl.col("Date") >= start_date) & (pl.col("Date") <= end_date)
+        # Stack both sources lazily, without rechunking, and tag their origin
+        transactions = pl.concat(
+            [
+                df_expenses.lazy()
+                .select("Date", "Value", self._month_start(df_expenses))
+                .with_columns(pl.lit("Expense").alias("Type")),
+                df_income.lazy()
+                .select("Date", "Value", self._month_start(df_income))
+                .with_columns(pl.lit("Income").alias("Type")),
+            ],
+            how="vertical",
+            rechunk=False,
         )
 
-        # Calculate monthly expenses
-        monthly_expenses = (
-            expenses_filtered.with_columns(
-                pl.col("Date").dt.strftime("%Y-%m").alias("Month")
+        # Aggregate expenses and income per month in a single plan, months
+        # present in only one source get a zero total for the other
+        return (
+            self._filter_date_range(transactions, start_date, end_date)
+            .group_by(pl.col("MonthStart").alias("Month"), maintain_order=False)
+            .agg(
+                pl.col("Value")
+                .filter(pl.col("Type") == "Expense")
+                .sum()
+                .alias("Expenses"),
+                pl.col("Value")
+                .filter(pl.col("Type") == "Income")
+                .sum()
+                .alias("Income"),
             )
-            .groupby("Month")
-            .agg(pl.sum("Value").alias("Expenses"))
             .sort("Month")
-        )
-
-        # Calculate monthly income
-        monthly_income = (
-            income_filtered.with_columns(
-                pl.col("Date").dt.strftime("%Y-%m").alias("Month")
+            .with_columns(
+                pl.col("Month").dt.strftime("%Y-%m"),
+                (pl.col("Income") - pl.col("Expenses")).alias("Balance"),
             )
-            .groupby("Month")
-            .agg(pl.sum("Value").alias("Income"))
-            .sort("Month")
         )
 
-        # Join expenses and income
-        monthly_summary = monthly_expenses.join(
-            monthly_income, on="Month", how="outer"
-        ).fill_null(0)
-
-        # Calculate balance
-        monthly_summary = monthly_summary.with_columns(
-            (pl.col("Income") - pl.col("Expenses")).alias("Balance")
-        )
-
-        return monthly_summary
-
     def category_breakdown(
         self,
         df: pl.DataFrame,
-        start_date: datetime,
-        end_date: datetime,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
         value_column: str = "Value",
     ) -> pl.DataFrame:
         """
@@ -390,47 +516,71 @@ class AnalyticsGenerator:
 
         Args:
             df: DataFrame to analyze
-            start_date: Start date for the analysis
-            end_date: End date for the analysis
+            start_date: Start date for the analysis, None if already filtered
+            end_date: End date for the analysis, None if already filtered
             value_column: Name of the value column
 
         Returns:
             pl.DataFrame: Category breakdown DataFrame
         """
         return (
-            df.filter((pl.col("Date") >= start_date) & (pl.col("Date") <= end_date))
-            .groupby("Category")
+            self._filter_date_range(df, start_date, end_date)
+            .group_by("Category", maintain_order=False)
+            .agg(pl.sum(value_column).alias("Total"))
+            .sort("Total", descending=True)
+        )
+
+    def category_breakdown_from_time_series(
+        self, df_time_series: FrameT, value_column: str = "Value"
+    ) -> FrameT:
+        """
+        Derive the breakdown of values by category from a monthly time series.
+
+        The time series is already reduced to one row per month and category,
+        so this avoids another pass over the individual records.
+
+        Args:
+            df_time_series: Output of time_series_by_category
+            value_column: Name of the value column in the time series
+
+        Returns:
+            FrameT: Category breakdown DataFrame or LazyFrame
+        """
+        return (
+            df_time_series.group_by("Category", maintain_order=False)
             .agg(pl.sum(value_column).alias("Total"))
             .sort("Total", descending=True)
         )
 
     def time_series_by_category(
         self,
-        df: pl.DataFrame,
-        start_date: datetime,
-        end_date: datetime,
+        df: FrameT,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
         value_column: str = "Value",
         output_column: str = "Value",
-    ) -> pl.DataFrame:
+    ) -> FrameT:
         """
         Generate time series data by category.
 
         Args:
-            df: DataFrame to analyze
-            start_date: Start date for the analysis
-            end_date: End date for the analysis
+            df: DataFrame or LazyFrame to analyze
+            start_date: Start date for the analysis, None if already filtered
+            end_date: End date for the analysis, None if already filtered
             value_column: Name of the input value column
             output_column: Name of the output value column
 
         Returns:
-            pl.DataFrame: Time series DataFrame
+            FrameT: Time series DataFrame or LazyFrame
         """
         return (
-            df.filter((pl.col("Date") >= start_date) & (pl.col("Date") <= end_date))
-            .with_columns(pl.col("Date").dt.strftime("%Y-%m").alias("Month"))
-            .groupby(["Month", "Category"])
+            self._filter_date_range(df, start_date, end_date)
+            .group_by(
+                [self._month_start(df).alias("Month"), "Category"], maintain_order=False
+            )
             .agg(pl.sum(value_column).alias(output_column))
             .sort(["Month", "Category"])
+            .with_columns(pl.col("Month").dt.strftime("%Y-%m"))
         )
 
     def calculate_savings_metrics(self, df_savings: pl.DataFrame) -> pl.DataFrame:
@@ -443,93 +593,46 @@ class AnalyticsGenerator:
         Returns:
             pl.DataFrame: Savings metrics DataFrame
         """
-        if len(df_savings) == 0:
+        if df_savings.is_empty():
             self.logger.warning("No savings data available for metrics calculation")
-            return pl.DataFrame(
-                schema={
-                    "Month": pl.Utf8,
-                    "TotalSavings": pl.Float64,
-                    "TotalAllocated": pl.Float64,
-                    "TotalSpent": pl.Float64,
-                }
+            return pl.DataFrame(schema=self.SAVINGS_METRICS_SCHEMA)
+
+        # Express every record as signed contributions to the three running
+        # totals: net savings, net allocations (additions minus withdrawals) and
+        # spent funds (withdrawals from Risparmio, counted as positive amounts).
+        # Each total is then a plain monthly sum followed by a cum_sum. The
+        # contributions are projected straight from the input, so no flagged
+        # copy of the savings frame is materialized first
+        is_savings = pl.col("CategoryType") == "Risparmio"
+        is_allocation = pl.col("CategoryType").is_in(self.ALLOCATION_CATEGORY_TYPES)
+        contributions = ["TotalSavings", "TotalAllocated", "TotalSpent"]
+        return (
+            df_savings.lazy()
+            .select(
+                self._month_start(df_savings),
+                pl.when(is_savings)
+                .then(pl.col("Value"))
+                .otherwise(0.0)
+                .alias("TotalSavings"),
+                pl.when(is_allocation)
+                .then(pl.col("Value"))
+                .otherwise(0.0)
+                .alias("TotalAllocated"),
+                pl.when(is_savings & (pl.col("Value") < 0))
+                .then(-pl.col("Value"))
+                .otherwise(0.0)
+                .alias("TotalSpent"),
             )
-
-        # Add Month column if not present
-        if "Month" not in df_savings.columns:
-            df_savings = df_savings.with_columns(
-                pl.col("Date").dt.strftime("%Y-%m").alias("Month")
+            .group_by("MonthStart", maintain_order=False)
+            .agg(pl.col(contributions).sum())
+            .sort("MonthStart")
+            .select(
+                pl.col("MonthStart").dt.strftime("%Y-%m").alias("Month"),
+                pl.col(contributions).cum_sum(),
             )
-
-        # Add allocation type based on category type
-        df_processed = df_savings.with_columns(
-            pl.when(pl.col("CategoryType") == "Accantonamento")
-            .then(pl.lit("Allocation"))
-            .otherwise(pl.lit("Savings"))
-            .alias("AllocationType")
+            .collect()
         )
 
-        # Calculate metrics by month
-        all_months = sorted(df_processed["Month"].unique().to_list())
-        metrics = []
-
-        # Running totals
-        total_savings = 0.0
-        total_allocated = 0.0
-        total_spent = 0.0
-
-        for month in all_months:
-            # Get data for this month
-            month_data = df_processed.filter(pl.col("Month") == month)
-
-            # Calculate net savings (including withdrawals from Risparmio categories)
-            month_savings = (
-                month_data.filter(pl.col("CategoryType") == "Risparmio")["Value"].sum()
-                or 0.0
-            )
-            total_savings += month_savings
-
-            # Calculate allocations (positive values in Accantonamento categories)
-            month_allocated = (
-                month_data.filter(
-                    (pl.col("CategoryType") == "Accantonamento") & (pl.col("Value") > 0)
-                )["Value"].sum()
-                or 0.0
-            )
-
-            # Calculate withdrawals from allocations
-            month_allocated_withdrawals = abs(
-                month_data.filter(
-                    (pl.col("CategoryType") == "Accantonamento") & (pl.col("Value") < 0)
-                )["Value"].sum()
-                or 0.0
-            )
-
-            # Update total allocated funds
-            total_allocated = (
-                total_allocated + month_allocated - month_allocated_withdrawals
-            )
-
-            # Calculate spent funds from savings (withdrawals from Risparmio categories)
-            month_spent_from_savings = abs(
-                month_data.filter(
-                    (pl.col("CategoryType") == "Risparmio") & (pl.col("Value") < 0)
-                )["Value"].sum()
-                or 0.0
-            )
-            total_spent += month_spent_from_savings
-
-            # Store monthly metrics
-            metrics.append(
-                {
-                    "Month": month,
-                    "TotalSavings": total_savings,
-                    "TotalAllocated": total_allocated,
-                    "TotalSpent": total_spent,
-                }
-            )
-
-        return pl.DataFrame(metrics)
-
     def savings_allocation_status(
         self, df_savings_metrics: pl.DataFrame, df_savings: pl.DataFrame
     ) -> pl.DataFrame:
@@ -543,91 +646,61 @@ class AnalyticsGenerator:
         Returns:
             pl.DataFrame: Allocation status DataFrame
         """
-        if len(df_savings_metrics) == 0 or len(df_savings) == 0:
+        if df_savings_metrics.is_empty() or df_savings.is_empty():
             self.logger.warning("No savings data available for allocation status")
-            return pl.DataFrame(
-                schema={
-                    "Category": pl.Utf8,
-                    "Type": pl.Utf8,
-                    "Value": pl.Float64,
-                }
-            )
+            return pl.DataFrame(schema=self.ALLOCATION_STATUS_SCHEMA)
 
         # Get the latest month
         last_month = df_savings_metrics["Month"].max()
 
-        # Filter savings data for the latest month
+        # Filter savings data for the latest month, comparing month start
+        # datetimes instead of formatting a month string for every record
+        last_month_start = datetime.strptime(last_month, "%Y-%m")
         monthly_data = df_savings.filter(
-            pl.col("Month") == last_month
-            if "Month" in df_savings.columns
-            else pl.col("Date").dt.strftime("%Y-%m") == last_month
+            self._month_start(df_savings) == last_month_start
         )
 
-        if len(monthly_data) == 0:
-            return pl.DataFrame(
-                schema={
-                    "Category": pl.Utf8,
-                    "Type": pl.Utf8,
-                    "Value": pl.Float64,
-                }
-            )
-
-        # Prepare visualization data
-        allocation_data = []
-
-        # Get all categories
-        categories = monthly_data["Category"].unique().to_list()
+        if monthly_data.is_empty():
+            return pl.DataFrame(schema=self.ALLOCATION_STATUS_SCHEMA)
+
+        # Sum the additions and withdrawals of every category in one pass, each
+        # category keeps the type of its first record
+        category_totals = monthly_data.group_by("Category", maintain_order=True).agg(
+            pl.col("CategoryType")
+            .first()
+            .is_in(self.ALLOCATION_CATEGORY_TYPES)
+            .alias("IsAllocation"),
+            pl.col("Value").filter(pl.col("Value") > 0).sum().alias("Added"),
+            pl.col("Value").filter(pl.col("Value") < 0).sum().abs().alias("Withdrawn"),
+        )
 
-        for category in categories:
-            # Get category data
-            category_data = monthly_data.filter(pl.col("Category") == category)
-            category_type = (
-                category_data["CategoryType"][0]
-                if len(category_data) > 0
-                else "Unknown"
+        # One row per category and direction that has transactions, additions
+        # before withdrawals within each category
+        return (
+            category_totals.with_row_index("Order")
+            .melt(
+                id_vars=["Order", "Category", "IsAllocation"],
+                value_vars=["Added", "Withdrawn"],
+                variable_name="Direction",
+                value_name="Value",
             )
-
-            # Process positive transactions (additions)
-            positive_data = category_data.filter(pl.col("Value") > 0)
-            if len(positive_data) > 0:
-                positive_sum = positive_data["Value"].sum()
-                allocation_data.append(
-                    {
-                        "Category": category,
-                        "Type": (
-                            "Allocated"
-                            if category_type == "Accantonamento"
-                            else "Saved"
-                        ),
-                        "Value": positive_sum,
-                    }
+            .filter(pl.col("Value") > 0)
+            .sort("Order", maintain_order=True)
+            .select(
+                pl.col("Category").cast(pl.Utf8),
+                pl.when(pl.col("Direction") == "Added")
+                .then(
+                    pl.when(pl.col("IsAllocation"))
+                    .then(pl.lit("Allocated"))
+                    .otherwise(pl.lit("Saved"))
                 )
-
-            # Process negative transactions (withdrawals)
-            negative_data = category_data.filter(pl.col("Value") < 0)
-            if len(negative_data) > 0:
-                negative_sum = abs(negative_data["Value"].sum())
-                allocation_data.append(
-                    {
-                        "Category": category,
-                        "Type": (
-                            "Spent from Allocations"
-                            if category_type == "Accantonamento"
-                            else "Spent from Savings"
-                        ),
-                        "Value": negative_sum,
-                    }
+                .otherwise(
+                    pl.when(pl.col("IsAllocation"))
+                    .then(pl.lit("Spent from Allocations"))
+                    .otherwise(pl.lit("Spent from Savings"))
                 )
-
-        return (
-            pl.DataFrame(allocation_data)
-            if allocation_data
-            else pl.DataFrame(
-                schema={
-                    "Category": pl.Utf8,
-                    "Type": pl.Utf8,
-                    "Value": pl.Float64,
-                }
+                .alias("Type"),
+                "Value",
             )
         )
 
@@ -653,18 +726,58 @@ class FileManager:
         self.output_folder = config.get("output_folder", "output")
         os.makedirs(self.output_folder, exist_ok=True)
 
-    def save_dataset(self, df: pl.DataFrame, config_key: str) -> bool:
+        # Directories already created, so each one is only made once
+        self._created_dirs = {self.output_folder}
+
+        # Format of the saved datasets, "csv" or "parquet"
+        self.output_format = config.get("output_format", "csv")
+
+    def _output_path(self, path: str) -> str:
+        """
+        Get the path a dataset is written to in the configured output format.
+
+        Args:
+            path: Configured dataset path
+
+        Returns:
+            str: Path with the extension of the output format
+        """
+        if self.output_format == "parquet":
+            return f"{os.path.splitext(path)[0]}.parquet"
+        return path
+
+    def _ensure_directory(self, path: str) -> None:
+        """
+        Create the parent directory of a path if it hasn't been created yet.
+
+        Args:
+            path: File path whose directory must exist
         """
-        Save a DataFrame to a CSV file.
+        directory = os.path.dirname(path)
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
+    def save_dataset(
+        self, df: Union[pl.DataFrame, pl.LazyFrame], config_key: str
+    ) -> bool:
+        """
+        Save a DataFrame to a CSV or Parquet file, following output_format.
+
+        LazyFrames are streamed to the file with sink_csv or sink_parquet,
+        without materializing the whole result first.
 
         Args:
-            df: DataFrame to save
+            df: DataFrame or LazyFrame to save
             config_key: Key in the configuration for the file path
 
         Returns:
             bool: True if saved successfully, False otherwise
         """
-        if len(df) == 0:
+        if isinstance(df, pl.LazyFrame):
+            return self._sink_dataset(df, config_key)
+
+        if df.is_empty():
             self.logger.warning(f"Empty DataFrame for {config_key}, skipping save")
             return False
 
@@ -672,21 +785,62 @@ class FileManager:
         if not path:
             self.logger.warning(f"Missing path configuration for {config_key}")
             return False
+        path = self._output_path(path)
 
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-
-            # Round all float columns to 2 decimal places before saving
-            df_to_save = df.clone()
-            for col in df.columns:
-                if df[col].dtype in (pl.Float32, pl.Float64):
-                    df_to_save = df_to_save.with_columns(
-                        pl.col(col).round(2).alias(col)
-                    )
+            self._ensure_directory(path)
+
+            # Round all float columns to 2 decimal places before saving, in a
+            # single with_columns over a dtype selector
+            df_to_save = df.with_columns(pl.col(pl.Float32, pl.Float64).round(2))
+
+            if self.output_format == "parquet":
+                # Parquet stores the floats as binary, no formatting needed
+                df_to_save.write_parquet(path, compression="zstd", statistics=True)
+            else:
+                # Save to CSV with proper floating point precision
+                df_to_save.write_csv(path, float_precision=2)
+            self.logger.info(f"Saved dataset to {path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error saving dataset to {path}: {e}")
+            return False
+
+    def _sink_dataset(self, lf: pl.LazyFrame, config_key: str) -> bool:
+        """
+        Stream a LazyFrame to a CSV or Parquet file, following output_format.
+
+        Args:
+            lf: LazyFrame to save
+            config_key: Key in the configuration for the file path
+
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        path = self.config.get(config_key)
+        if not path:
+            self.logger.warning(f"Missing path configuration for {config_key}")
+            return False
+        path = self._output_path(path)
+
+        # Round all float columns to 2 decimal places as part of the plan
+        lf_to_save = lf.with_columns(pl.col(pl.Float32, pl.Float64).round(2))
 
-            # Save to CSV with proper floating point precision
-            df_to_save.write_csv(path, float_precision=2)
+        try:
+            self._ensure_directory(path)
+            try:
+                if self.output_format == "parquet":
+                    lf_to_save.sink_parquet(path, compression="zstd")
+                else:
+                    lf_to_save.sink_csv(path, float_precision=2)
+            except (
+                pl.exceptions.InvalidOperationError,
+                pl.exceptions.ComputeError,
+            ):
+                # The streaming engine doesn't support every plan, fall back to
+                # collecting it first
+                return self.save_dataset(lf_to_save.collect(), config_key)
             self.logger.info(f"Saved dataset to {path}")
             return True
         except Exception as e:
@@ -721,8 +875,26 @@ class Process:
         self.analytics_generator = AnalyticsGenerator(config, logger)
         self.file_manager = FileManager(config, logger)
 
+        # Valid categories of each data type, built once and reused by every
+        # category normalization
+        self._valid_categories: Dict[str, pl.Series] = {
+            data_type: pl.Series(
+                config.get(f"valid_{data_type}_categories", []), dtype=pl.Utf8
+            )
+            for data_type in ("expenses", "income", "savings")
+        }
+
+        # Format of the raw date column, None lets the transformer detect it
+        self.raw_date_format: Optional[str] = config.get("raw_date_format")
+
+        # Whether records go through the row-by-row schema validation
+        self.validate_records = config.get("validate_records", True)
+
     def process_expense_income_data(
-        self, df: pl.DataFrame, data_type: str = "expenses"
+        self,
+        df: pl.DataFrame,
+        data_type: str = "expenses",
+        validate: Optional[bool] = None,
     ) -> pl.DataFrame:
         """
         Process expense or income data into a standardized format.
@@ -730,10 +902,14 @@ class Process:
         Args:
             df: Raw expense or income DataFrame
             data_type: Type of data ("expenses" or "income")
+            validate: Whether to validate every record, defaults to the
+                validate_records setting
 
         Returns:
             pl.DataFrame: Standardized DataFrame with consistent schema
         """
+        validate_records = self.validate_records if validate is None else validate
+
         self.logger.info(f"Processing {data_type} data with {len(df)} rows")
 
         # Get the appropriate column mapping
@@ -743,54 +919,82 @@ class Process:
             self.logger.error(error_msg)
             raise ValueError(error_msg)
 
-        # Drop "Mese" column if it exists
-        if "Mese" in df.columns:
-            df = df.drop("Mese")
-
-        # Clean and standardize data
-        df_cleaned = self.data_transformer.clean_string_columns(df)
-        df_date = self.data_transformer.standardize_date_format(df_cleaned, "Data")
-
-        # Rename columns according to mapping
-        df_renamed = df_date.rename(column_mapping)
-
-        # Validate categories
-        valid_categories = self.config.get(f"valid_{data_type}_categories", [])
+        # Categories accepted for this data type
+        valid_categories = self._valid_categories[data_type]
         default_category = self.config.get("default_category", "Altro")
 
-        df_with_valid_categories = self.data_transformer.normalize_categories(
-            df_renamed, valid_categories, default_category
+        # Run the cleaning steps as one lazy plan: drop "Mese" if it exists,
+        # clean strings, parse dates and rename. The plan is collected before
+        # normalizing categories, whose warning counts would otherwise run the
+        # string cleaning and date parsing a second time
+        df_cleaned = (
+            df.lazy()
+            .select(pl.exclude("Mese"))
+            .pipe(self.data_transformer.clean_string_columns)
+            .pipe(
+                self.data_transformer.standardize_date_format,
+                "Data",
+                self.raw_date_format,
+            )
+            .rename(column_mapping)
+            .collect()
         )
-
-        # Validate data against schema
-        df_validated, errors = self.schema_validator.validate_expense_income(
-            df_with_valid_categories
+        df_with_valid_categories = self.data_transformer.normalize_categories(
+            df_cleaned, valid_categories, default_category
         )
 
-        if errors:
-            self.logger.warning(
-                f"Encountered {len(errors)} validation errors during {data_type} processing"
+        if validate_records:
+            # Validate data against schema
+            df_validated, errors = self.schema_validator.validate_expense_income(
+                df_with_valid_categories
             )
 
-        # Make sure there's no month column in the output
-        if "Mese" in df_validated.columns:
-            df_validated = df_validated.drop("Mese")
+            if errors:
+                self.logger.warning(
+                    f"Encountered {len(errors)} validation errors during {data_type} processing"
+                )
+
+            # Store the normalized categories as an Enum
+            df_validated = self.data_transformer.encode_categories(
+                df_validated, valid_categories, default_category
+            )
+        else:
+            # Trusted input, project onto the record schema without row checks
+            # and encode the categories in the same plan
+            df_validated = (
+                df_with_valid_categories.lazy()
+                .select(
+                    "Date", "Description", "Category", pl.col("Value").cast(pl.Float64)
+                )
+                .pipe(
+                    self.data_transformer.encode_categories,
+                    valid_categories,
+                    default_category,
+                )
+                .collect()
+            )
 
         self.logger.info(
             f"Successfully processed {len(df_validated)} {data_type} records"
         )
         return df_validated
 
-    def process_savings_data(self, df: pl.DataFrame) -> pl.DataFrame:
+    def process_savings_data(
+        self, df: pl.DataFrame, validate: Optional[bool] = None
+    ) -> pl.DataFrame:
         """
         Process savings data into a standardized format.
 
         Args:
             df: Raw savings DataFrame
+            validate: Whether to validate every record, defaults to the
+                validate_records setting
 
         Returns:
             pl.DataFrame: Standardized DataFrame with consistent schema
         """
+        validate_records = self.validate_records if validate is None else validate
+
         self.logger.info(f"Processing savings data with {len(df)} rows")
 
         # Get column mapping from config
@@ -800,38 +1004,71 @@ class Process:
             self.logger.error(error_msg)
             raise ValueError(error_msg)
 
-        # Drop "Mese" column if it exists
-        if "Mese" in df.columns:
-            df = df.drop("Mese")
-
-        # Clean and standardize data
-        df_cleaned = self.data_transformer.clean_string_columns(df)
-        df_date = self.data_transformer.standardize_date_format(df_cleaned, "Data")
-
-        # Rename columns according to mapping
-        df_renamed = df_date.rename(column_mapping)
-
-        # Validate categories
-        valid_categories = self.config.get("valid_savings_categories", [])
+        # Categories accepted for this data type
+        valid_categories = self._valid_categories["savings"]
         default_category = self.config.get("default_category", "Varie")
 
+        # Run the cleaning steps as one lazy plan: drop "Mese" if it exists,
+        # clean strings, parse dates and rename. The plan is collected before
+        # normalizing categories, whose warning counts would otherwise run the
+        # string cleaning and date parsing a second time
+        df_cleaned = (
+            df.lazy()
+            .select(pl.exclude("Mese"))
+            .pipe(self.data_transformer.clean_string_columns)
+            .pipe(
+                self.data_transformer.standardize_date_format,
+                "Data",
+                self.raw_date_format,
+            )
+            .rename(column_mapping)
+            .collect()
+        )
         df_with_valid_categories = self.data_transformer.normalize_categories(
-            df_renamed, valid_categories, default_category
+            df_cleaned, valid_categories, default_category
         )
 
-        # Validate data against schema
-        df_validated, errors = self.schema_validator.validate_savings(
-            df_with_valid_categories
-        )
+        if validate_records:
+            # Validate data against schema
+            df_validated, errors = self.schema_validator.validate_savings(
+                df_with_valid_categories
+            )
+
+            if errors:
+                self.logger.warning(
+                    f"Encountered {len(errors)} validation errors during savings processing"
+                )
 
-        if errors:
-            self.logger.warning(
-                f"Encountered {len(errors)} validation errors during savings processing"
+            # Store the normalized categories as an Enum
+            df_validated = self.data_transformer.encode_categories(
+                df_validated, valid_categories, default_category
+            )
+        else:
+            # Trusted input, project onto the record schema without row checks
+            # and encode the categories in the same plan
+            df_validated = (
+                df_with_valid_categories.lazy()
+                .select(
+                    "Date",
+                    "Description",
+                    "Category",
+                    pl.col("Value").cast(pl.Float64),
+                    "CategoryType",
+                )
+                .pipe(
+                    self.data_transformer.encode_categories,
+                    valid_categories,
+                    default_category,
+                )
+                .collect()
             )
 
-        # Make sure there's no month column in the output
-        if "Mese" in df_validated.columns:
-            df_validated = df_validated.drop("Mese")
+        # Category types are a handful of repeated labels compared on every
+        # savings aggregation, store them as a Categorical
+        if "CategoryType" in df_validated.columns:
+            df_validated = df_validated.with_columns(
+                pl.col("CategoryType").cast(pl.Categorical)
+            )
 
         self.logger.info(f"Successfully processed {len(df_validated)} savings records")
         return df_validated
@@ -852,73 +1089,89 @@ class Process:
         """
         self.logger.info("Generating all datasets for visualization...")
 
-        # Calculate date range - use all available data
-        min_date = min(
-            df_expenses["Date"].min(),
-            df_income["Date"].min(),
-            (
-                df_savings["Date"].min()
-                if df_savings is not None and len(df_savings) > 0
-                else datetime.now()
-            ),
+        # Calculate date range - use all available data, reducing the dates of
+        # every source in a single engine call
+        has_savings = df_savings is not None and not df_savings.is_empty()
+        date_sources = [df_expenses, df_income] + ([df_savings] if has_savings else [])
+        min_date, max_date = (
+            pl.concat([df.lazy().select("Date") for df in date_sources], rechunk=False)
+            .select(
+                pl.col("Date").min().alias("MinDate"),
+                pl.col("Date").max().alias("MaxDate"),
+            )
+            .collect()
+            .row(0)
         )
 
-        max_date = max(
-            df_expenses["Date"].max(),
-            df_income["Date"].max(),
-            (
-                df_savings["Date"].max()
-                if df_savings is not None and len(df_savings) > 0
-                else datetime.now()
-            ),
-        )
+        # Without savings data the current date takes part in the range
+        if not has_savings:
+            now = datetime.now()
+            min_date, max_date = min(min_date, now), max(max_date, now)
 
         self.logger.info(
             f"Generating datasets for date range: {min_date.date()} to {max_date.date()}"
         )
 
-        # Generate and save monthly summary
-        monthly_summary = self.analytics_generator.monthly_summary(
-            df_expenses, df_income, min_date, max_date
+        # The range spans every expense and income record by construction, so
+        # restricting to it only drops undated records. Do that once, in lazy
+        # plans the generators below share, and key every record on its month
+        lf_expenses = self.data_transformer.add_month_start_column(
+            df_expenses.lazy().drop_nulls("Date")
+        )
+        lf_income = self.data_transformer.add_month_start_column(
+            df_income.lazy().drop_nulls("Date")
+        )
+        if df_savings is not None:
+            df_savings = self.data_transformer.add_month_start_column(df_savings)
+
+        # Plan the expense and income datasets lazily and collect them in one
+        # call, the independent plans run in parallel and the category totals
+        # share the monthly series they are derived from
+        expenses_stacked_plan = self.analytics_generator.time_series_by_category(
+            lf_expenses, value_column="Value", output_column="Expenses"
+        )
+        income_stacked_plan = self.analytics_generator.time_series_by_category(
+            lf_income, value_column="Value", output_column="Income"
         )
+        (
+            monthly_summary,
+            expenses_stacked,
+            expenses_by_category,
+            income_stacked,
+            income_by_category,
+        ) = pl.collect_all(
+            [
+                self.analytics_generator.monthly_summary_plan(lf_expenses, lf_income),
+                expenses_stacked_plan,
+                self.analytics_generator.category_breakdown_from_time_series(
+                    expenses_stacked_plan, "Expenses"
+                ),
+                income_stacked_plan,
+                self.analytics_generator.category_breakdown_from_time_series(
+                    income_stacked_plan, "Income"
+                ),
+            ]
+        )
+
+        # Save monthly summary
         self.file_manager.save_dataset(monthly_summary, "monthly_summary_path")
 
-        # Generate and save expenses summaries
+        # Save expenses summaries
         monthly_expenses = monthly_summary.select(["Month", "Expenses"])
         self.file_manager.save_dataset(monthly_expenses, "monthly_expenses_path")
-
-        expenses_by_category = self.analytics_generator.category_breakdown(
-            df_expenses, min_date, max_date
-        )
+        self.file_manager.save_dataset(expenses_stacked, "expenses_stacked_path")
         self.file_manager.save_dataset(
             expenses_by_category, "expenses_by_category_path"
         )
 
-        expenses_stacked = self.analytics_generator.time_series_by_category(
-            df_expenses, min_date, max_date, "Value", "Expenses"
-        )
-        self.file_manager.save_dataset(expenses_stacked, "expenses_stacked_path")
-
-        # Generate and save income summaries
+        # Save income summaries
         monthly_income = monthly_summary.select(["Month", "Income"])
         self.file_manager.save_dataset(monthly_income, "monthly_income_path")
-
-        income_by_category = self.analytics_generator.category_breakdown(
-            df_income, min_date, max_date
-        )
-        self.file_manager.save_dataset(income_by_category, "income_by_category_path")
-
-        income_stacked = self.analytics_generator.time_series_by_category(
-            df_income, min_date, max_date, "Value", "Income"
-        )
         self.file_manager.save_dataset(income_stacked, "income_stacked_path")
+        self.file_manager.save_dataset(income_by_category, "income_by_category_path")
 
         # Generate savings datasets if available
-        if df_savings is not None and len(df_savings) > 0:
-            # Ensure Month column exists
-            if "Month" not in df_savings.columns:
-                df_savings = self.data_transformer.add_month_column(df_savings)
-
+        if df_savings is not None and not df_savings.is_empty():
             # Calculate and save savings metrics
             savings_metrics = self.analytics_generator.calculate_savings_metrics(
                 df_savings
@@ -926,17 +1179,19 @@ class Process:
             self.file_manager.save_dataset(savings_metrics, "savings_metrics_path")
 
             # Get last month data for category breakdown
-            if len(savings_metrics) > 0:
+            if not savings_metrics.is_empty():
                 last_month = savings_metrics["Month"].max()
-                last_month_data = savings_metrics.filter(pl.col("Month") == last_month)
+                last_month_start = datetime.strptime(last_month, "%Y-%m")
 
-                # Generate savings category breakdown
+                # Generate savings category breakdown, records are matched on
+                # their month start so no month string is formatted per record
                 savings_by_category = (
-                    df_savings.filter(
+                    df_savings.lazy()
+                    .filter(
                         (pl.col("CategoryType") == "Risparmio")
-                        & (pl.col("Month") == last_month)
+                        & (pl.col("MonthStart") == last_month_start)
                     )
-                    .groupby("Category")
+                    .group_by("Category", maintain_order=False)
                     .agg(pl.sum("Value").alias("Value"))
                 )
                 self.file_manager.save_dataset(
@@ -0,0 +1,407 @@
+#!filepath: tests/test_callbacks.py
+"""
+Test suite for the dashboard dataset loader.
+
+This module contains tests for the loading and filtering of datasets by the
+DatasetLoader class in dashboard/callbacks.py.
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import polars as pl
+
+# Add the project root to the Python path, and the src folder for the flat
+# imports between the src modules
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, "src"))
+
+from src.dashboard.callbacks import (  # pylint: disable=wrong-import-position,import-error
+    DatasetLoader,
+)
+from src.process import (  # pylint: disable=wrong-import-position,import-error
+    FileManager,
+)
+
+
+def make_config(values: dict) -> MagicMock:
+    """Create a config mock whose get method reads from a dictionary."""
+    config = MagicMock()
+    config.get.side_effect = lambda key, default=None: values.get(key, default)
+    return config
+
+
+class TestLoadDataset(unittest.TestCase):
+    """Tests for reading the generated datasets in the configured format."""
+
+    def setUp(self) -> None:
+        """Set up a temporary output folder and a monthly dataset."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.logger = logging.getLogger("test_callbacks")
+        self.logger.setLevel(logging.CRITICAL)
+        self.df = pl.DataFrame(
+            {
+                "Month": ["2024-01", "2024-02", "2024-03"],
+                "Expenses": [120.456, 80.0, 95.5],
+            }
+        )
+
+    def tearDown(self) -> None:
+        """Remove the temporary output folder."""
+        self.temp_dir.cleanup()
+
+    def round_trip(self, output_format: str) -> DatasetLoader:
+        """Save the dataset and return a loader reading the same configuration."""
+        config = make_config(
+            {
+                "output_folder": self.temp_dir.name,
+                "output_format": output_format,
+                "monthly_expenses_path": os.path.join(
+                    self.temp_dir.name, "monthly_expenses.csv"
+                ),
+            }
+        )
+        self.assertTrue(
+            FileManager(config, self.logger).save_dataset(
+                self.df, "monthly_expenses_path"
+            )
+        )
+        return DatasetLoader(config, self.logger)
+
+    def test_csv_round_trip(self) -> None:
+        """Test that a dataset saved as CSV is read back from the CSV."""
+        loader = self.round_trip("csv")
+
+        df = loader._load_dataset("monthly_expenses_path")
+
+        self.assertEqual(os.listdir(self.temp_dir.name), ["monthly_expenses.csv"])
+        self.assertEqual(df["Month"].to_list(), ["2024-01", "2024-02", "2024-03"])
+        self.assertEqual(df["Expenses"].to_list(), [120.46, 80.0, 95.5])
+
+    def test_parquet_round_trip(self) -> None:
+        """Test that a dataset saved as Parquet is read back from the Parquet file."""
+        loader = self.round_trip("parquet")
+
+        df = loader._load_dataset("monthly_expenses_path")
+
+        self.assertEqual(os.listdir(self.temp_dir.name), ["monthly_expenses.parquet"])
+        self.assertEqual(df["Month"].to_list(), ["2024-01", "2024-02", "2024-03"])
+        self.assertEqual(df["Expenses"].to_list(), [120.46, 80.0, 95.5])
+
+    def test_filter_monthly_datasets(self) -> None:
+        """Test that every month range is applied, in the order requested."""
+        loader = self.round_trip("parquet")
+
+        first_two, missing, last = loader.filter_monthly_datasets(
+            [
+                ("monthly_expenses_path", "2024-01", "2024-02"),
+                ("savings_metrics_path", "2024-01", "2024-03"),
+                ("monthly_expenses_path", "2024-03", "2024-03"),
+            ]
+        )
+
+        self.assertEqual(first_two["Month"].to_list(), ["2024-01", "2024-02"])
+        self.assertEqual(last["Month"].to_list(), ["2024-03"])
+        self.assertIsNone(missing)
+
+    def test_filter_covering_whole_dataset(self) -> None:
+        """Test that a range spanning every month returns the loaded frame."""
+        loader = self.round_trip("csv")
+        df = loader._load_dataset("monthly_expenses_path")
+
+        (filtered,) = loader.filter_monthly_datasets(
+            [("monthly_expenses_path", "2023-12", "2024-03")]
+        )
+
+        self.assertIs(filtered, df)
+
+    def test_reuses_loaded_dataset_until_file_changes(self) -> None:
+        """Test that a dataset is read again only after its file changes."""
+        loader = self.round_trip("csv")
+        path = os.path.join(self.temp_dir.name, "monthly_expenses.csv")
+
+        first = loader._load_dataset("monthly_expenses_path")
+        self.assertIs(loader._load_dataset("monthly_expenses_path"), first)
+
+        pl.DataFrame({"Month": ["2024-04"], "Expenses": [10.0]}).write_csv(path)
+        mtime = os.path.getmtime(path) + 10
+        os.utime(path, (mtime, mtime))
+
+        self.assertEqual(
+            loader._load_dataset("monthly_expenses_path")["Month"].to_list(),
+            ["2024-04"],
+        )
+
+    def test_data_signature_follows_file_changes(self) -> None:
+        """Test that rewriting or removing a loaded dataset changes the signature."""
+        loader = self.round_trip("csv")
+        path = os.path.join(self.temp_dir.name, "monthly_expenses.csv")
+        loader._load_dataset("monthly_expenses_path")
+        signature = loader.data_signature()
+
+        mtime = os.path.getmtime(path) + 10
+        os.utime(path, (mtime, mtime))
+        changed = loader.data_signature()
+        os.remove(path)
+        removed = loader.data_signature()
+
+        self.assertNotEqual(changed, signature)
+        self.assertEqual(changed, (0, mtime))
+        self.assertEqual(removed, (0, None))
+
+    def test_data_signature_file_removed_during_stat(self) -> None:
+        """Test that a file removed right after the existence check is no error."""
+        loader = self.round_trip("csv")
+        loader._load_dataset("monthly_expenses_path")
+
+        with patch(
+            "src.dashboard.callbacks.os.path.getmtime", side_effect=FileNotFoundError
+        ):
+            self.assertEqual(loader.data_signature(), (0, None))
+
+    def test_missing_dataset(self) -> None:
+        """Test that a dataset missing in the configured format returns None."""
+        self.round_trip("csv")
+        loader = DatasetLoader(
+            make_config(
+                {
+                    "output_format": "parquet",
+                    "monthly_expenses_path": os.path.join(
+                        self.temp_dir.name, "monthly_expenses.csv"
+                    ),
+                }
+            ),
+            self.logger,
+        )
+
+        self.assertIsNone(loader._load_dataset("monthly_expenses_path"))
+
+
+class TestCalculateCategoryBreakdown(unittest.TestCase):
+    """Tests for DatasetLoader.calculate_category_breakdown."""
+
+    def setUp(self) -> None:
+        """Set up a loader holding a processed expenses dataset."""
+        self.logger = logging.getLogger("test_callbacks")
+        self.logger.setLevel(logging.CRITICAL)
+        self.loader = DatasetLoader(make_config({}), self.logger)
+        self.loader.datasets["processed_expenses"] = pl.DataFrame(
+            {
+                "Date": [
+                    datetime(2024, 1, 5),
+                    datetime(2024, 1, 20),
+                    datetime(2024, 1, 31),
+                    datetime(2024, 2, 1),
+                    datetime(2024, 2, 14),
+                    datetime(2024, 3, 3),
+                ],
+                "Category": ["Spesa", "Casa", "Spesa", "Spesa", "Svago", "Casa"],
+                "Value": [10.0, 800.0, 25.0, 15.0, 40.0, 800.0],
+            }
+        ).set_sorted("Date")
+
+    def breakdown(self, start_date: datetime, end_date: datetime) -> dict:
+        """Get the category breakdown of a range as a category to total dict."""
+        result = self.loader.calculate_category_breakdown(
+            "processed_expenses", start_date, end_date
+        )
+        self.assertIsNotNone(result)
+        self.assertEqual(
+            result["Total"].to_list(), sorted(result["Total"], reverse=True)
+        )
+        return dict(result.iter_rows())
+
+    def test_whole_month_range(self) -> None:
+        """Test a single whole month, read from the monthly totals."""
+        self.assertEqual(
+            self.breakdown(datetime(2024, 1, 1), datetime(2024, 1, 31)),
+            {"Casa": 800.0, "Spesa": 35.0},
+        )
+
+    def test_multi_month_range(self) -> None:
+        """Test a range of several whole months."""
+        self.assertEqual(
+            self.breakdown(datetime(2024, 1, 1), datetime(2024, 2, 29)),
+            {"Casa": 800.0, "Spesa": 50.0, "Svago": 40.0},
+        )
+
+    def test_partial_range(self) -> None:
+        """Test a range that starts and ends within months."""
+        self.assertEqual(
+            self.breakdown(datetime(2024, 1, 20), datetime(2024, 2, 10)),
+            {"Casa": 800.0, "Spesa": 40.0},
+        )
+
+    def test_partial_range_matches_transactions(self) -> None:
+        """Test that whole-month and partial ranges agree on the same records."""
+        whole_months = self.breakdown(datetime(2024, 1, 1), datetime(2024, 3, 31))
+        partial = self.breakdown(datetime(2024, 1, 2), datetime(2024, 3, 31))
+
+        self.assertEqual(whole_months, partial)
+
+    def test_sub_day_timestamps(self) -> None:
+        """Test that timestamps within a day are not moved by the monthly totals."""
+        self.loader.datasets["processed_expenses"] = pl.DataFrame(
+            {
+                "Date": [datetime(2024, 1, 5), datetime(2024, 1, 31, 12, 0)],
+                "Category": ["Spesa", "Casa"],
+                "Value": [10.0, 800.0],
+            }
+        ).set_sorted("Date")
+
+        # The end date is midnight of the month's last day, so the afternoon
+        # transaction falls outside the range
+        self.assertEqual(
+            self.breakdown(datetime(2024, 1, 1), datetime(2024, 1, 31)),
+            {"Spesa": 10.0},
+        )
+
+    def test_monthly_totals_built_once(self) -> None:
+        """Test that whole-month ranges reuse one set of monthly totals."""
+        self.breakdown(datetime(2024, 1, 1), datetime(2024, 1, 31))
+        totals = self.loader._category_totals["processed_expenses"]
+
+        self.breakdown(datetime(2024, 2, 1), datetime(2024, 2, 29))
+
+        self.assertIs(self.loader._category_totals["processed_expenses"], totals)
+        self.assertEqual(
+            totals.filter(pl.col("Date") == datetime(2024, 1, 1))
+            .sort("Category")
+            .rows(),
+            [
+                (datetime(2024, 1, 1), "Casa", 800.0),
+                (datetime(2024, 1, 1), "Spesa", 35.0),
+            ],
+        )
+
+    def test_empty_range(self) -> None:
+        """Test that a range without transactions returns None."""
+        result = self.loader.calculate_category_breakdown(
+            "processed_expenses", datetime(2023, 1, 1), datetime(2023, 1, 31)
+        )
+
+        self.assertIsNone(result)
+
+    def test_missing_dataset(self) -> None:
+        """Test that an unknown dataset returns None."""
+        result = self.loader.calculate_category_breakdown(
+            "processed_income", datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+
+        self.assertIsNone(result)
+
+
+class TestLoadMemoryMapped(unittest.TestCase):
+    """Tests for the Arrow IPC copies of the processed datasets."""
+
+    def setUp(self) -> None:
+        """Set up a loader reading from a temporary folder."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.temp_dir.name, "processed_expenses.csv")
+        self.cache_folder = os.path.join(self.temp_dir.name, "cache")
+        self.csv_mtime = time.time()
+        self.logger = logging.getLogger("test_callbacks")
+        self.logger.setLevel(logging.CRITICAL)
+        self.loader = DatasetLoader(
+            make_config(
+                {
+                    "processed_expenses_path": self.csv_path,
+                    "cache_folder": self.cache_folder,
+                }
+            ),
+            self.logger,
+        )
+
+    def tearDown(self) -> None:
+        """Remove the temporary folder."""
+        self.temp_dir.cleanup()
+
+    def write_csv(self, dates: list, values: list) -> None:
+        """Write a processed CSV and move its modification time forward."""
+        pl.DataFrame(
+            {
+                "Date": dates,
+                "Category": ["Spesa"] * len(dates),
+                "Value": values,
+            }
+        ).write_csv(self.csv_path)
+        # Newer than any IPC copy written before, whatever the clock resolution
+        self.csv_mtime += 10
+        os.utime(self.csv_path, (self.csv_mtime, self.csv_mtime))
+
+    def load(self):
+        """Load the processed expenses through their IPC copy."""
+        return self.loader._load_memory_mapped(
+            "processed_expenses", "processed_expenses_path"
+        )
+
+    def test_missing_csv(self) -> None:
+        """Test that a missing CSV returns None without writing a copy."""
+        self.assertIsNone(self.load())
+        self.assertFalse(os.path.exists(self.cache_folder))
+
+    def test_builds_ipc_copy_with_parsed_dates(self) -> None:
+        """Test that the CSV is copied to IPC with its Date column parsed."""
+        self.write_csv(["2024-01-05", "2024-02-10"], [10.0, 20.0])
+
+        df = self.load()
+
+        self.assertEqual(df.schema["Date"], pl.Datetime)
+        self.assertEqual(
+            df["Date"].to_list(), [datetime(2024, 1, 5), datetime(2024, 2, 10)]
+        )
+        self.assertEqual(os.listdir(self.cache_folder), ["processed_expenses.arrow"])
+
+    def test_rebuild_keeps_mapped_frames_valid(self) -> None:
+        """Test that rebuilding the copy does not touch frames mapped earlier."""
+        self.write_csv(["2024-01-05", "2024-02-10"], [10.0, 20.0])
+        first = self.load()
+        ipc_path = os.path.join(self.cache_folder, "processed_expenses.arrow")
+        first_inode = os.stat(ipc_path).st_ino
+
+        self.write_csv(["2024-03-01", "2024-03-02", "2024-03-03"], [1.0, 2.0, 3.0])
+        second = self.load()
+
+        # The copy is replaced by a new file, not rewritten in place
+        self.assertNotEqual(os.stat(ipc_path).st_ino, first_inode)
+        self.assertEqual(first["Value"].to_list(), [10.0, 20.0])
+        self.assertEqual(second["Value"].to_list(), [1.0, 2.0, 3.0])
+        self.assertEqual(os.listdir(self.cache_folder), ["processed_expenses.arrow"])
+
+    def test_reuses_up_to_date_ipc_copy(self) -> None:
+        """Test that a copy newer than its CSV is mapped without a rebuild."""
+        self.write_csv(["2024-02-10", "2024-01-05"], [20.0, 10.0])
+        self.load()
+        ipc_path = os.path.join(self.cache_folder, "processed_expenses.arrow")
+        os.utime(ipc_path, (self.csv_mtime + 5, self.csv_mtime + 5))
+        inode = os.stat(ipc_path).st_ino
+
+        df = self.load()
+
+        self.assertEqual(os.stat(ipc_path).st_ino, inode)
+        self.assertEqual(df["Value"].to_list(), [10.0, 20.0])
+        self.assertEqual(df["Date"].flags["SORTED_ASC"], True)
+
+    def test_rebuilds_unreadable_ipc_copy(self) -> None:
+        """Test that a copy that cannot be read is rebuilt from the CSV."""
+        self.write_csv(["2024-01-05", "2024-02-10"], [10.0, 20.0])
+        os.makedirs(self.cache_folder)
+        ipc_path = os.path.join(self.cache_folder, "processed_expenses.arrow")
+        with open(ipc_path, "w", encoding="utf-8") as f:
+            f.write("not an arrow file")
+        os.utime(ipc_path, (self.csv_mtime + 5, self.csv_mtime + 5))
+
+        df = self.load()
+
+        self.assertEqual(df["Value"].to_list(), [10.0, 20.0])
+        self.assertEqual(pl.read_ipc(ipc_path)["Value"].to_list(), [10.0, 20.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,283 @@
+#!filepath: tests/test_process.py
+"""
+Test suite for the data processing module.
+
+This module contains tests for the transformation and analytics classes in
+process.py.
+"""
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import polars as pl
+
+# Add the project root to the Python path, and the src folder for the flat
+# imports between the src modules
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, "src"))
+
+from src.process import (  # pylint: disable=wrong-import-position,import-error
+    AnalyticsGenerator,
+    DataTransformer,
+    SchemaValidator,
+)
+
+
+def make_config(values: dict) -> MagicMock:
+    """Create a config mock whose get method reads from a dictionary."""
+    config = MagicMock()
+    config.get.side_effect = lambda key, default=None: values.get(key, default)
+    return config
+
+
+class TestSchemaValidator(unittest.TestCase):
+    """Tests for the vectorized schema validation."""
+
+    def setUp(self) -> None:
+        """Set up a validator with a silenced logger."""
+        self.logger = logging.getLogger("test_process")
+        self.logger.setLevel(logging.CRITICAL)
+        self.validator = SchemaValidator(self.logger)
+
+    def test_validate_expense_income(self) -> None:
+        """Test that valid rows are cast to the expense and income schema."""
+        df = pl.DataFrame(
+            {
+                "Date": [datetime(2024, 1, 5), datetime(2024, 2, 10)],
+                "Description": ["Groceries", "Rent"],
+                "Category": ["Spesa", "Casa"],
+                "Value": ["12.5", "700"],
+            }
+        )
+
+        result, errors = self.validator.validate_expense_income(df)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(result.schema, SchemaValidator.EXPENSE_INCOME_SCHEMA)
+        self.assertEqual(result["Value"].to_list(), [12.5, 700.0])
+
+    def test_validate_savings_drops_invalid_rows(self) -> None:
+        """Test that rows with missing or unconvertible values are rejected."""
+        df = pl.DataFrame(
+            {
+                "Date": [datetime(2024, 1, 5), datetime(2024, 1, 6), None],
+                "Description": ["a", "b", "c"],
+                "Category": ["Risparmio", "Viaggi", "Risparmio"],
+                "Value": ["100", "not a number", "50"],
+                "CategoryType": ["Risparmio", "Accantonamento", "Risparmio"],
+            }
+        )
+
+        result, errors = self.validator.validate_savings(df)
+
+        self.assertEqual(result.schema, SchemaValidator.SAVINGS_SCHEMA)
+        self.assertEqual(result["Description"].to_list(), ["a"])
+        self.assertEqual(
+            errors,
+            [
+                "Row validation error: missing or invalid Value",
+                "Row validation error: missing or invalid Date",
+            ],
+        )
+
+    def test_validate_all_rows_invalid(self) -> None:
+        """Test that an empty frame is returned when no row is valid."""
+        df = pl.DataFrame(
+            {
+                "Date": [None],
+                "Description": ["a"],
+                "Category": ["Spesa"],
+                "Value": [1.0],
+            },
+            schema_overrides={"Date": pl.Datetime},
+        )
+
+        result, errors = self.validator.validate_expense_income(df)
+
+        self.assertTrue(result.is_empty())
+        self.assertEqual(len(errors), 1)
+
+    def test_validate_missing_column(self) -> None:
+        """Test that a missing schema column is reported as a single error."""
+        df = pl.DataFrame({"Date": [datetime(2024, 1, 5)], "Value": [1.0]})
+
+        result, errors = self.validator.validate_expense_income(df)
+
+        self.assertTrue(result.is_empty())
+        self.assertEqual(
+            errors, ["Missing required columns: ['Description', 'Category']"]
+        )
+
+
+class TestDataTransformer(unittest.TestCase):
+    """Tests for the DataTransformer date handling."""
+
+    def setUp(self) -> None:
+        """Set up a transformer with an empty configuration."""
+        self.logger = logging.getLogger("test_process")
+        self.transformer = DataTransformer(make_config({}), self.logger)
+
+    def test_standardize_mixed_date_formats(self) -> None:
+        """Test that every supported format is parsed in the same column."""
+        df = pl.DataFrame({"Date": ["05/01/24", "2024-02-10", "2024-03-15 10:30:00"]})
+
+        result = self.transformer.standardize_date_format(df)
+
+        self.assertEqual(result.schema["Date"], pl.Datetime)
+        self.assertEqual(
+            result["Date"].to_list(),
+            [
+                datetime(2024, 1, 5),
+                datetime(2024, 2, 10),
+                datetime(2024, 3, 15, 10, 30),
+            ],
+        )
+
+    def test_standardize_unparseable_dates(self) -> None:
+        """Test that values matching no format become null instead of raising."""
+        df = pl.DataFrame({"Date": ["05/01/24", "not a date", None]})
+
+        result = self.transformer.standardize_date_format(df)
+
+        self.assertEqual(result["Date"].to_list(), [datetime(2024, 1, 5), None, None])
+
+    def test_standardize_with_known_format(self) -> None:
+        """Test that a known format is used first and others still parse."""
+        df = pl.DataFrame({"Data": ["05/01/2024", "2024-02-10", "garbage"]})
+
+        result = self.transformer.standardize_date_format(df, "Data", "%d/%m/%Y")
+
+        self.assertEqual(
+            result["Data"].to_list(),
+            [datetime(2024, 1, 5), datetime(2024, 2, 10), None],
+        )
+
+    def test_standardize_date_column(self) -> None:
+        """Test that a Date column is converted to Datetime."""
+        df = pl.DataFrame({"Date": [datetime(2024, 1, 5).date()]})
+
+        result = self.transformer.standardize_date_format(df)
+
+        self.assertEqual(result.schema["Date"], pl.Datetime)
+        self.assertEqual(result["Date"].to_list(), [datetime(2024, 1, 5)])
+
+    def test_standardize_datetime_column(self) -> None:
+        """Test that a Datetime column is returned unchanged."""
+        df = pl.DataFrame({"Date": [datetime(2024, 1, 5, 8, 15)]})
+
+        result = self.transformer.standardize_date_format(df)
+
+        self.assertIs(result, df)
+
+
+class TestAnalyticsGenerator(unittest.TestCase):
+    """Tests for the savings analytics."""
+
+    def setUp(self) -> None:
+        """Set up a generator writing to a temporary output folder."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.logger = logging.getLogger("test_process")
+        self.logger.setLevel(logging.CRITICAL)
+        self.generator = AnalyticsGenerator(
+            make_config({"output_folder": self.temp_dir.name}), self.logger
+        )
+        self.df_savings = pl.DataFrame(
+            {
+                "Date": [
+                    datetime(2024, 1, 3),
+                    datetime(2024, 1, 10),
+                    datetime(2024, 1, 25),
+                    datetime(2024, 2, 2),
+                    datetime(2024, 2, 12),
+                    datetime(2024, 2, 20),
+                    datetime(2024, 2, 28),
+                ],
+                "Description": ["a", "b", "c", "d", "e", "f", "g"],
+                "Category": [
+                    "Risparmio",
+                    "Viaggi",
+                    "Risparmio",
+                    "Risparmio",
+                    "Viaggi",
+                    "Viaggi",
+                    "Risparmio",
+                ],
+                "Value": [500.0, 200.0, -50.0, 300.0, 100.0, -150.0, -20.0],
+                "CategoryType": [
+                    "Risparmio",
+                    "Accantonamento",
+                    "Risparmio",
+                    "Risparmio",
+                    "Accantonamento",
+                    "Accantonamento",
+                    "Risparmio",
+                ],
+            }
+        )
+
+    def tearDown(self) -> None:
+        """Remove the temporary output folder."""
+        self.temp_dir.cleanup()
+
+    def test_calculate_savings_metrics(self) -> None:
+        """Test the running savings, allocation and spending totals by month."""
+        result = self.generator.calculate_savings_metrics(self.df_savings)
+
+        self.assertEqual(
+            result.columns, ["Month", "TotalSavings", "TotalAllocated", "TotalSpent"]
+        )
+        self.assertEqual(result["Month"].to_list(), ["2024-01", "2024-02"])
+        self.assertEqual(result["TotalSavings"].to_list(), [450.0, 730.0])
+        self.assertEqual(result["TotalAllocated"].to_list(), [200.0, 150.0])
+        self.assertEqual(result["TotalSpent"].to_list(), [50.0, 70.0])
+
+    def test_calculate_savings_metrics_unsorted_input(self) -> None:
+        """Test that running totals follow month order, not input row order."""
+        result = self.generator.calculate_savings_metrics(self.df_savings.reverse())
+
+        self.assertEqual(result["Month"].to_list(), ["2024-01", "2024-02"])
+        self.assertEqual(result["TotalSavings"].to_list(), [450.0, 730.0])
+        self.assertEqual(result["TotalAllocated"].to_list(), [200.0, 150.0])
+        self.assertEqual(result["TotalSpent"].to_list(), [50.0, 70.0])
+
+    def test_calculate_savings_metrics_empty(self) -> None:
+        """Test that empty input returns an empty frame with the metrics schema."""
+        result = self.generator.calculate_savings_metrics(self.df_savings.clear())
+
+        self.assertTrue(result.is_empty())
+        self.assertEqual(result.schema, AnalyticsGenerator.SAVINGS_METRICS_SCHEMA)
+
+    def test_savings_allocation_status(self) -> None:
+        """Test the additions and withdrawals of each category in the last month."""
+        df_metrics = self.generator.calculate_savings_metrics(self.df_savings)
+
+        result = self.generator.savings_allocation_status(df_metrics, self.df_savings)
+
+        self.assertEqual(result.schema, AnalyticsGenerator.ALLOCATION_STATUS_SCHEMA)
+        self.assertEqual(
+            result.rows(),
+            [
+                ("Risparmio", "Saved", 300.0),
+                ("Risparmio", "Spent from Savings", 20.0),
+                ("Viaggi", "Allocated", 100.0),
+                ("Viaggi", "Spent from Allocations", 150.0),
+            ],
+        )
+
+    def test_savings_allocation_status_no_data_in_last_month(self) -> None:
+        """Test that a latest month without transactions returns an empty frame."""
+        df_metrics = pl.DataFrame({"Month": ["2024-03"]}, schema={"Month": pl.Utf8})
+
+        result = self.generator.savings_allocation_status(df_metrics, self.df_savings)
+
+        self.assertTrue(result.is_empty())
+        self.assertEqual(result.schema, AnalyticsGenerator.ALLOCATION_STATUS_SCHEMA)
+
+
+if __name__ == "__main__":
+    unittest.main()